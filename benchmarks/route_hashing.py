@@ -0,0 +1,46 @@
+"""Benchmark the per-render cost of hashing route trees of increasing size.
+
+Each time a router renders, it fingerprints its route tree to decide whether the routes need to be
+recompiled. Since routes cache their hashes when they are created, this cost should stay flat as the
+total number of routes grows (it only depends on the number of top-level routes).
+
+Usage: `python benchmarks/route_hashing.py`. Results are printed as JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+
+from reactpy_router import route
+from reactpy_router.tables import tree_fingerprint
+
+TOP_LEVEL_ROUTES = 10
+SIZES = (10, 100, 1_000, 10_000)
+
+
+def build_tree(size: int) -> tuple:
+    """Build a route tree with `size` routes in total, nested beneath a fixed number of top-level routes."""
+    children_per_route = size // TOP_LEVEL_ROUTES - 1
+    return tuple(
+        route(
+            f"/section-{i}",
+            f"section {i}",
+            *(route(f"/page-{j}/{{id:int}}", f"page {j}") for j in range(children_per_route)),
+        )
+        for i in range(TOP_LEVEL_ROUTES)
+    )
+
+
+def measure(size: int, number: int = 1_000) -> dict[str, float | int]:
+    routes = build_tree(size)
+    return {
+        "routes": size,
+        "hash_us": timeit.timeit(lambda: hash(routes), number=number) / number * 1e6,
+        "tree_fingerprint_us": timeit.timeit(lambda: tree_fingerprint(routes), number=number) / number * 1e6,
+    }
+
+
+if __name__ == "__main__":
+    sys.stdout.write(json.dumps([measure(size) for size in SIZES], indent=2) + "\n")
@@ -0,0 +1,155 @@
+"""In-process benchmark suite for ReactPy-Router's resolvers and routers.
+
+This suite doesn't require a browser. For each resolver and route table size, it measures:
+
+- `compile_ms`: The time to compile the route table (bypassing the process-wide table cache).
+- `memory_kib`: The memory allocated while compiling the route table.
+- `hit_us` / `miss_us`: The time to match a path that hits or misses, without the table's match cache.
+- `cached_hit_us`: The time to resolve a path that is already within the table's match cache.
+- `render_us`: The time to re-render a router through a ReactPy `Layout`.
+
+Usage: `python benchmarks/routing.py [--sizes 10 100] [--resolvers TrieResolver] [--output results.json]`.
+Results are written as JSON, so that they can be compared between releases.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import re
+import sys
+import timeit
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Any
+
+from reactpy import component, html, use_state
+from reactpy.core.hooks import ConnectionContext
+from reactpy.core.layout import Layout
+from reactpy.types import Connection, Location
+
+from reactpy_router import __version__, route
+from reactpy_router.resolvers import AlternationResolver, ReactPyResolver, TrieResolver
+from reactpy_router.routers import _iter_routes, create_router
+from reactpy_router.tables import compile_table
+
+SECTIONS = 10
+SIZES = (10, 100, 1_000, 10_000)
+RESOLVERS = {resolver.__name__: resolver for resolver in (ReactPyResolver, TrieResolver, AlternationResolver)}
+PAGE_TEMPLATES = (
+    ("/page-{n}", "/page-{n}"),
+    ("/page-{n}/{{id:int}}", "/page-{n}/42"),
+    ("/page-{n}/{{name:slug}}/edit", "/page-{n}/some-article/edit"),
+    ("/page-{n}/{{item:uuid}}", f"/page-{{n}}/{uuid.UUID(int=0)}"),
+    ("/page-{n}/files/{{rest:path}}", "/page-{n}/files/a/b/c.txt"),
+)
+
+
+def generate_routes(size: int) -> tuple[tuple[Any, ...], list[str]]:
+    """Generate a route tree with `size` routes in total that uses a mixture of converters.
+
+    Returns the top-level routes, and one matching path for each route."""
+    children_per_section = max(size // SECTIONS - 1, 0)
+    routes = []
+    paths = []
+    for section in range(SECTIONS):
+        children = []
+        for n in range(children_per_section):
+            template, example = PAGE_TEMPLATES[n % len(PAGE_TEMPLATES)]
+            children.append(route(template.format(n=n), html.p(f"page {n}")))
+            paths.append(f"/section-{section}" + example.format(n=n))
+        routes.append(route(f"/section-{section}", html.p(f"section {section}"), *children))
+        paths.append(f"/section-{section}")
+    return tuple(routes), paths
+
+
+def time_us(function: Any, number: int) -> float:
+    return timeit.timeit(function, number=number) / number * 1e6
+
+
+def measure_table(resolver: Any, routes: tuple[Any, ...], paths: list[str], number: int) -> dict[str, float]:
+    flat_routes = [flat_route for _, flat_route in _iter_routes(routes)]
+
+    # Clear the `re` module's pattern cache, so that every regex is compiled from scratch
+    re.purge()
+    tracemalloc.start()
+    table = compile_table(resolver, flat_routes)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    compile_ms = time_us(lambda: (re.purge(), compile_table(resolver, flat_routes)), number=3) / 1000
+    sample = paths[:: max(len(paths) // 50, 1)]
+    misses = [f"/missing-{i}/page" for i in range(len(sample))]
+
+    def match_all(lookups: list[str]) -> float:
+        return time_us(lambda: [table.match(path) for path in lookups], number) / len(lookups)
+
+    table.resolve(sample[0])
+    return {
+        "compile_ms": compile_ms,
+        "memory_kib": memory / 1024,
+        "hit_us": match_all(sample),
+        "miss_us": match_all(misses),
+        "cached_hit_us": time_us(lambda: table.resolve(sample[0]), number),
+    }
+
+
+async def measure_render(resolver: Any, routes: tuple[Any, ...], path: str, number: int) -> float:
+    router = create_router(resolver)
+    set_count_ref: list[Any] = []
+
+    @component
+    def root():
+        count, set_count = use_state(0)
+        set_count_ref[:] = [set_count]
+        return html.div({"data-count": count}, router(*routes))
+
+    connection = Connection(scope={}, location=Location(path, ""), carrier=None)
+    async with Layout(ConnectionContext(root(), value=connection)) as layout:
+        await layout.render()
+        elapsed = 0.0
+        for count in range(1, number + 1):
+            set_count_ref[0](count)
+            start = timeit.default_timer()
+            await layout.render()
+            elapsed += timeit.default_timer() - start
+    return elapsed / number * 1e6
+
+
+def run(sizes: list[int], resolvers: list[str], number: int) -> dict[str, Any]:
+    results = []
+    for size in sizes:
+        routes, paths = generate_routes(size)
+        for name in resolvers:
+            resolver = RESOLVERS[name]
+            result = {"resolver": name, "routes": len(paths)}
+            result.update(measure_table(resolver, routes, paths, number))
+            result["render_us"] = asyncio.run(measure_render(resolver, routes, paths[-1], max(number // 10, 1)))
+            results.append(result)
+    return {
+        "reactpy_router": __version__,
+        "python": platform.python_version(),
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--resolvers", nargs="+", choices=list(RESOLVERS), default=list(RESOLVERS))
+    parser.add_argument("--number", type=int, default=200, help="Number of repetitions for each timing.")
+    parser.add_argument("--output", help="Write the results to this file instead of stdout.")
+    args = parser.parse_args()
+
+    output = json.dumps(run(args.sizes, args.resolvers, args.number), indent=2) + "\n"
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    else:
+        sys.stdout.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
 import { React } from "@reactpy/client";
-import { createLocationObject, pushState, replaceState } from "./utils";
-import { HistoryProps, LinkProps, NavigateProps } from "./types";
+import { createSequencedLocationObject, pushState, replaceState } from "./utils";
+import {
+  HistoryProps,
+  LinkListenerProps,
+  NavigateProps,
+  ReplaceLocationProps,
+  ReplaceSearchProps,
+} from "./types";
 
 /**
  * Interface used to bind a ReactPy node to React.
@@ -19,75 +25,235 @@ export function bind(node: HTMLElement | Element | Node) {
   };
 }
 
+/**
+ * How long to wait for further "popstate" events before notifying the server, in milliseconds.
+ */
+const POPSTATE_COALESCE_DELAY = 50;
+
 /**
  * History component that captures browser "history go back" actions and notifies the server.
+ *
+ * Bursts of "popstate" events (such as `navigate(-5)` or holding the back button) are coalesced,
+ * so the server is only told about the final location. Each notification has a sequence number
+ * (shared with every other navigation), which lets the server ignore notifications that arrive
+ * out of order.
  */
 export function History({ onHistoryPreviousCallback }: HistoryProps): null {
+  // Keep the latest callback in a ref, so the listener doesn't need to be re-registered on re-render
+  const callbackRef = React.useRef(onHistoryPreviousCallback);
+  callbackRef.current = onHistoryPreviousCallback;
+
   // Tell the server about history "popstate" events
   React.useEffect(() => {
+    let timeout: ReturnType<typeof setTimeout> | undefined;
     const listener = () => {
-      onHistoryPreviousCallback(createLocationObject());
+      clearTimeout(timeout);
+      timeout = setTimeout(
+        () => callbackRef.current(createSequencedLocationObject()),
+        POPSTATE_COALESCE_DELAY,
+      );
     };
 
     // Register the event listener
     window.addEventListener("popstate", listener);
 
     // Delete the event listener when the component is unmounted
-    return () => window.removeEventListener("popstate", listener);
-  });
+    return () => {
+      clearTimeout(timeout);
+      window.removeEventListener("popstate", listener);
+    };
+  }, []);
   return null;
 }
 
 /**
- * Link component that captures clicks on anchor links and notifies the server.
+ * Attribute that marks an anchor as being managed by ReactPy-Router's server-side link component.
+ */
+const LINK_ATTRIBUTE = "data-reactpy-router-link";
+
+/**
+ * Attribute that marks the element containing a router's content, whose value is the router's ID.
+ */
+const ROUTER_ATTRIBUTE = "data-reactpy-router";
+
+/**
+ * Attribute that marks an anchor whose route should be prefetched, either on "hover" or when "visible".
+ */
+const PREFETCH_ATTRIBUTE = "data-reactpy-router-prefetch";
+
+/**
+ * Milliseconds before a URL can be prefetched again, which matches the server's `_Prefetches.dedupe_seconds`.
+ */
+const PREFETCH_DEDUPE_MS = 30_000;
+
+/**
+ * Link listener component that captures clicks on every router-managed anchor and notifies the server.
+ *
+ * A single delegated listener is registered on the document when the router mounts, rather than one
+ * listener per link. Anchors are found via the `LINK_ATTRIBUTE` data attribute, so links that are
+ * added or re-rendered later are handled without any extra work. Each router only handles the links
+ * whose nearest `ROUTER_ATTRIBUTE` element is its own, so sibling and nested routers each handle
+ * their own links.
  *
- * This component is not the actual `<a>` link element. It is just an event
- * listener for ReactPy-Router's server-side link component.
+ * Anchors with a `PREFETCH_ATTRIBUTE` are also reported to the server (at most once per URL) when they
+ * are hovered, focused, or scrolled into view, so the server can prepare their routes before a click.
  */
-export function Link({ onClickCallback, linkClass }: LinkProps): null {
+export function LinkListener({
+  routerId,
+  onClickCallback,
+  onPrefetchCallback,
+}: LinkListenerProps): null {
+  // Keep the latest callbacks in refs, so the listeners don't need to be re-registered on re-render
+  const callbackRef = React.useRef(onClickCallback);
+  callbackRef.current = onClickCallback;
+  const prefetchCallbackRef = React.useRef(onPrefetchCallback);
+  prefetchCallbackRef.current = onPrefetchCallback;
+
   React.useEffect(() => {
-    // Event function that will tell the server about clicks.
+    const ownsLink = (link: Element | null | undefined): link is Element =>
+      !!link &&
+      link.closest(`[${ROUTER_ATTRIBUTE}]`)?.getAttribute(ROUTER_ATTRIBUTE) ===
+        routerId;
+
     // Preserve the browser's default behavior (open in new tab/window) for
     // modifier-clicks and middle-click — only plain left-clicks are routed
     // through the SPA history handler.
-    const handleClick = (event: Event) => {
-      let click_event = event as MouseEvent;
+    const handleClick = (event: MouseEvent) => {
       const isPlainLeftClick =
-        click_event.button === 0 &&
-        !click_event.ctrlKey &&
-        !click_event.metaKey &&
-        !click_event.shiftKey &&
-        !click_event.altKey;
-      if (isPlainLeftClick) {
+        event.button === 0 &&
+        !event.ctrlKey &&
+        !event.metaKey &&
+        !event.shiftKey &&
+        !event.altKey;
+      // Clicks that were already handled (such as by a nested router) are ignored
+      if (!isPlainLeftClick || event.defaultPrevented) {
+        return;
+      }
+      const link = (event.target as Element | null)?.closest?.(
+        `a[${LINK_ATTRIBUTE}]`,
+      );
+      const to = ownsLink(link) ? link.getAttribute("href") : null;
+      if (to) {
         event.preventDefault();
-        let to = (event.currentTarget as HTMLElement).getAttribute("href");
-        if (to) {
-          pushState(to);
-          onClickCallback(createLocationObject());
+        pushState(to);
+        callbackRef.current(createSequencedLocationObject());
+      }
+    };
+
+    // Each URL is prefetched at most once per dedupe window. The server may still drop a prefetch (for
+    // example, when it is rate limited), so entries expire rather than blocking a URL until unmounted.
+    const prefetched = new Map<string, number>();
+    const prefetch = (link: Element) => {
+      const to = link.getAttribute("href");
+      if (!to || !prefetchCallbackRef.current) {
+        return;
+      }
+      const url = new URL(to, window.location.href);
+      const path = url.pathname + url.search;
+      const now = Date.now();
+      const last = prefetched.get(path);
+      if (
+        url.origin === window.location.origin &&
+        (last === undefined || now - last >= PREFETCH_DEDUPE_MS)
+      ) {
+        prefetched.set(path, now);
+        prefetchCallbackRef.current({
+          path: url.pathname,
+          query_string: url.search,
+        });
+      }
+    };
+
+    const handleHover = (event: Event) => {
+      const link = (event.target as Element | null)?.closest?.(
+        `a[${LINK_ATTRIBUTE}][${PREFETCH_ATTRIBUTE}="hover"]`,
+      );
+      if (ownsLink(link)) {
+        prefetch(link);
+      }
+    };
+
+    // Links that are prefetched when visible are observed as they are added to the document. They stay
+    // observed, so that they can be prefetched again once their entry has expired.
+    const visibleSelector = `a[${LINK_ATTRIBUTE}][${PREFETCH_ATTRIBUTE}="visible"]`;
+    const intersectionObserver = new IntersectionObserver((entries) => {
+      for (const entry of entries) {
+        if (entry.isIntersecting) {
+          prefetch(entry.target);
         }
       }
+    });
+    const observeLinks = (node: Node) => {
+      if (node instanceof Element) {
+        if (node.matches(visibleSelector) && ownsLink(node)) {
+          intersectionObserver.observe(node);
+        }
+        node.querySelectorAll(visibleSelector).forEach((link) => {
+          if (ownsLink(link)) {
+            intersectionObserver.observe(link);
+          }
+        });
+      }
     };
+    const mutationObserver = new MutationObserver((mutations) => {
+      for (const mutation of mutations) {
+        mutation.addedNodes.forEach(observeLinks);
+      }
+    });
+    observeLinks(document.body);
+    mutationObserver.observe(document.body, { childList: true, subtree: true });
 
-    // Register the event listener on every anchor sharing this link's class.
-    // A page may render multiple links that share the unique class (e.g. when
-    // the same `link` component is reused), so use querySelectorAll rather
-    // than querySelector to wire all of them.
-    const links = document.querySelectorAll(`.${linkClass}`);
-    if (links.length === 0) {
-      console.warn(`Link component with class name ${linkClass} not found.`);
-    } else {
-      links.forEach((link) => {
-        link.addEventListener("click", handleClick);
-      });
-    }
+    // Register the event listeners
+    document.addEventListener("click", handleClick);
+    document.addEventListener("mouseover", handleHover);
+    document.addEventListener("focusin", handleHover);
 
-    // Delete the event listeners when the component is unmounted
+    // Delete the event listeners when the router is unmounted
     return () => {
-      links.forEach((link) => {
-        link.removeEventListener("click", handleClick);
-      });
+      document.removeEventListener("click", handleClick);
+      document.removeEventListener("mouseover", handleHover);
+      document.removeEventListener("focusin", handleHover);
+      mutationObserver.disconnect();
+      intersectionObserver.disconnect();
     };
-  });
+  }, [routerId]);
+  return null;
+}
+
+/**
+ * Client-side portion of `use_set_search_params`, which replaces the query string of the browser's URL
+ * without creating a history entry or notifying the server.
+ */
+export function ReplaceSearch({ path, search }: ReplaceSearchProps): null {
+  React.useEffect(() => {
+    if (
+      window.location.pathname === path &&
+      window.location.search !== search
+    ) {
+      const url = new URL(window.location.href);
+      url.search = search;
+      window.history.replaceState(window.history.state, "", url);
+    }
+  }, [path, search]);
+  return null;
+}
+
+/**
+ * Client-side portion of redirect routes, which replaces the browser's URL with the location that the
+ * server redirected to. No history entry is created, and the server isn't notified, since it has
+ * already rendered the redirect's target.
+ */
+export function ReplaceLocation({
+  from,
+  to,
+  sequence,
+}: ReplaceLocationProps): null {
+  React.useEffect(() => {
+    // The URL is left alone if the user has already navigated somewhere else
+    if (window.location.pathname + window.location.search === from) {
+      replaceState(to);
+    }
+  }, [from, to, sequence]);
   return null;
 }
 
@@ -111,7 +277,7 @@ export function Navigate({
       } else {
         pushState(to);
       }
-      onNavigateCallback(createLocationObject());
+      onNavigateCallback(createSequencedLocationObject());
     }
     return () => {};
   }, []);
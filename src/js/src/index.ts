@@ -1 +1,8 @@
-export { bind, History, Link, Navigate } from "./components";
+export {
+  bind,
+  History,
+  LinkListener,
+  Navigate,
+  ReplaceLocation,
+  ReplaceSearch,
+} from "./components";
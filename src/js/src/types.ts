@@ -3,17 +3,33 @@ export interface ReactPyLocation {
   query_string: string;
 }
 
+export interface SequencedLocation extends ReactPyLocation {
+  seq: number;
+}
+
 export interface HistoryProps {
-  onHistoryPreviousCallback: (location: ReactPyLocation) => void;
+  onHistoryPreviousCallback: (location: SequencedLocation) => void;
 }
 
-export interface LinkProps {
-  onClickCallback: (location: ReactPyLocation) => void;
-  linkClass: string;
+export interface LinkListenerProps {
+  routerId: string;
+  onClickCallback: (location: SequencedLocation) => void;
+  onPrefetchCallback?: (location: ReactPyLocation) => void;
 }
 
 export interface NavigateProps {
-  onNavigateCallback: (location: ReactPyLocation) => void;
+  onNavigateCallback: (location: SequencedLocation) => void;
   to: string | number;
   replace?: boolean;
 }
+
+export interface ReplaceSearchProps {
+  path: string;
+  search: string;
+}
+
+export interface ReplaceLocationProps {
+  from: string;
+  to: string;
+  sequence: number;
+}
@@ -1,4 +1,10 @@
-import { ReactPyLocation } from "./types";
+import { ReactPyLocation, SequencedLocation } from "./types";
+
+/**
+ * The sequence number of the last navigation reported to the server. This is shared by every
+ * component, so that the server can tell which navigation is the newest.
+ */
+let navigationSequence = 0;
 
 export function createLocationObject(): ReactPyLocation {
   return {
@@ -7,6 +13,11 @@ export function createLocationObject(): ReactPyLocation {
   };
 }
 
+export function createSequencedLocationObject(): SequencedLocation {
+  navigationSequence += 1;
+  return { ...createLocationObject(), seq: navigationSequence };
+}
+
 export function pushState(to: any): void {
   if (typeof to !== "string") {
     console.error("pushState() requires a string argument.");
@@ -1,16 +1,30 @@
 __version__ = "3.0.0b1"
 
 
-from reactpy_router.components import link, navigate, route
-from reactpy_router.hooks import use_params, use_search_params
+from reactpy_router.components import lazy, link, navigate, outlet, redirect, route
+from reactpy_router.hooks import (
+    use_loader_data,
+    use_navigation,
+    use_outlet,
+    use_params,
+    use_search_params,
+    use_set_search_params,
+)
 from reactpy_router.routers import browser_router, create_router
 
 __all__ = (
     "browser_router",
     "create_router",
+    "lazy",
     "link",
     "navigate",
+    "outlet",
+    "redirect",
     "route",
+    "use_loader_data",
+    "use_navigation",
+    "use_outlet",
     "use_params",
     "use_search_params",
+    "use_set_search_params",
 )
@@ -1,26 +1,55 @@
 from __future__ import annotations
 
+import re
+import threading
+from importlib import import_module
 from pathlib import Path
+from string import Formatter
 from typing import TYPE_CHECKING, Any
-from uuid import uuid4
 
-from reactpy import component, html, use_connection, use_ref
+from reactpy import component, html, use_connection
 from reactpy.reactjs import component_from_file
 from reactpy.types import Location
 
-from reactpy_router.hooks import _use_route_state
+from reactpy_router.hooks import _use_route_state, use_outlet
+from reactpy_router.resolvers import ReactPyResolver
 from reactpy_router.types import Route
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from reactpy.types import Component, Key, VdomDict
 
+    from reactpy_router.types import RouteLoader
+
 History = component_from_file(
     Path(__file__).parent / "static" / "bundle.js", import_names="History", name="reactpy-router"
 )
 """Client-side portion of history handling"""
 
-Link = component_from_file(Path(__file__).parent / "static" / "bundle.js", import_names="Link", name="reactpy-router")
-"""Client-side portion of link handling"""
+LinkListener = component_from_file(
+    Path(__file__).parent / "static" / "bundle.js", import_names="LinkListener", name="reactpy-router"
+)
+"""Client-side portion of link handling, which captures clicks on every link rendered within a router"""
+
+LINK_ATTRIBUTE = "data-reactpy-router-link"
+"""The attribute used by `LinkListener` to find the anchors that are managed by the router"""
+
+ROUTER_ATTRIBUTE = "data-reactpy-router"
+"""The attribute that marks the element containing a router's content, so `LinkListener` only handles its own links"""
+
+PREFETCH_ATTRIBUTE = "data-reactpy-router-prefetch"
+"""The attribute used by `LinkListener` to find the anchors whose routes should be prefetched"""
+
+ReplaceSearch = component_from_file(
+    Path(__file__).parent / "static" / "bundle.js", import_names="ReplaceSearch", name="reactpy-router"
+)
+"""Client-side portion of `use_set_search_params`, which replaces the query string of the browser's URL"""
+
+ReplaceLocation = component_from_file(
+    Path(__file__).parent / "static" / "bundle.js", import_names="ReplaceLocation", name="reactpy-router"
+)
+"""Client-side portion of redirect routes, which replaces the browser's URL with the redirect's target"""
 
 Navigate = component_from_file(
     Path(__file__).parent / "static" / "bundle.js", import_names="Navigate", name="reactpy-router"
@@ -28,59 +57,187 @@ Navigate = component_from_file(
 """Client-side portion of the navigate component"""
 
 
-def link(attributes: dict[str, Any], *children: Any, key: Key | None = None) -> Component:
+def link(attributes: dict[str, Any], *children: Any, key: Key | None = None) -> VdomDict:
     """
     Create a link with the given attributes and children.
 
+    Links are plain `<a>` elements, rather than components. Clicks on them are captured by the \
+    nearest router that contains them, so each link doesn't need its own state or event handlers.
+
+    A link's route can be prefetched before it is clicked by setting its `prefetch` attribute to \
+    `"hover"` (when the link is hovered or focused) or `"visible"` (when the link is scrolled into view). \
+    Prefetching imports the route's lazy elements and, if the router has a `loader_cache`, loads its data.
+
     Args:
         attributes: A dictionary of attributes for the link.
         *children: Child elements to be included within the link.
+        key: An optional key for the link element.
 
     Returns:
-        A link component with the specified attributes and children.
+        A link element with the specified attributes and children.
     """
-    return _link(attributes, *children, key=key)
-
-
-@component
-def _link(attributes: dict[str, Any], *children: Any) -> VdomDict:
     attributes = attributes.copy()
-    class_name = use_ref(f"link-{uuid4().hex}").current
-    set_location = _use_route_state().set_location
-    if "className" in attributes:
-        class_name = " ".join([attributes.pop("className"), class_name])
     if "href" in attributes and "to" not in attributes:
         attributes["to"] = attributes.pop("href")
-    if "to" not in attributes:  # pragma: no cover
+    if "to" not in attributes:
         msg = "The `to` attribute is required for the `link` component."
         raise ValueError(msg)
     to = attributes.pop("to")
+    prefetch = attributes.pop("prefetch", None)
+    if prefetch is not None:
+        if prefetch not in ("hover", "visible"):
+            msg = f"The `prefetch` attribute must be 'hover' or 'visible', not {prefetch!r}."
+            raise ValueError(msg)
+        attributes[PREFETCH_ATTRIBUTE] = prefetch
+    if key is not None:
+        attributes["key"] = key
 
-    attrs = {
-        **attributes,
-        "href": to,
-        "className": class_name,
-    }
+    # Clicks are captured by the router's `LinkListener`, rather than by a listener for each link
+    return html.a({**attributes, "href": to, LINK_ATTRIBUTE: ""}, *children)
 
-    def on_click_callback(_event: dict[str, Any]) -> None:
-        set_location(Location(**_event))
 
-    return html(Link({"onClickCallback": on_click_callback, "linkClass": class_name}), html.a(attrs, *children))
-
-
-def route(path: str, element: Any | None, *routes: Route) -> Route:
+def route(
+    path: str,
+    element: Any | None,
+    *routes: Route,
+    layout: bool = False,
+    loader: RouteLoader | None = None,
+) -> Route:
     """
     Create a route with the given path, element, and child routes.
 
     Args:
         path: The path for the route.
-        element: The element to render for this route. Can be None.
+        element: The element to render for this route. Can be None. If this is a zero-argument \
+            callable (such as a component function), it will be called to create the element the \
+            first time this route is matched. See `lazy` for more details.
         routes: Additional child routes.
+        layout: If True, this route's element is also rendered when one of its child routes is \
+            matched, and stays mounted while navigating between them. The matched child is rendered \
+            wherever the element uses `outlet` (or `use_outlet`).
+        loader: An optional async function that loads this route's data. It is called with the \
+            parameters of the matched path, at the same time as the loaders of the matched route's \
+            parents. The route is rendered once its data has loaded, and can read it via `use_loader_data`.
 
     Returns:
         The created route object.
     """
-    return Route(path, element, routes)
+    if callable(element) and not isinstance(element, LazyElement):
+        element = LazyElement(element)
+    return Route(path, element, routes, layout, loader)
+
+
+def redirect(path: str, to: str, *, resolver: type[ReactPyResolver] = ReactPyResolver) -> Route:
+    """
+    Create a route that redirects to another path.
+
+    Redirects are resolved by the router while it matches the current location, so the target \
+    route is rendered in the same pass. The browser's URL is then replaced with the target, \
+    without adding a history entry or waiting for the browser to report the new location.
+
+    Args:
+        path: The path for the route.
+        to: The path to redirect to. It can refer to the parameters of this route's path (such as \
+            `"/users/{id}"`), and can include a query string. If it doesn't, the current query \
+            string is kept.
+        resolver: The resolver of the router this route is used with, whose parameter syntax \
+            is used to find the parameters of `path`.
+
+    Returns:
+        The created route object.
+
+    Raises:
+        ValueError: If `to` isn't an absolute path, or refers to a parameter that isn't part of `path`.
+    """
+    if not to.startswith("/"):
+        msg = f"Redirect targets must be absolute paths, not {to!r}."
+        raise ValueError(msg)
+
+    # Check the target now, rather than failing when the redirect is followed
+    param_names = {match.group("name") for match in re.finditer(resolver.param_pattern, path)}
+    try:
+        field_names = {field_name for _, field_name, _, _ in Formatter().parse(to) if field_name is not None}
+    except ValueError as error:
+        msg = f"The redirect target {to!r} is not a valid format string: {error}"
+        raise ValueError(msg) from error
+    numeric = sorted(name for name in field_names if name.isdigit())
+    if numeric:
+        msg = f"The redirect target {to!r} can't refer to numeric parameters: {', '.join(numeric)}"
+        raise ValueError(msg)
+    unknown = sorted(field_names - param_names)
+    if unknown:
+        msg = f"The redirect target {to!r} refers to parameters that aren't part of {path!r}: {', '.join(unknown)}"
+        raise ValueError(msg)
+    return Route(path, None, (), redirect=to)
+
+
+def outlet() -> Component:
+    """
+    Render the element of the matched child route, within the element of a layout route.
+
+    Returns:
+        A component that renders the matched child route, or nothing if the layout route itself was matched.
+    """
+    return _outlet()
+
+
+@component
+def _outlet() -> Any:
+    return use_outlet()
+
+
+def lazy(source: str | Callable[[], Any]) -> LazyElement:
+    """
+    Create a route element that is only imported and created the first time its route is matched.
+
+    Args:
+        source: Either a zero-argument callable that creates the element, or an import string \
+            in the format `"module:attribute"`. If the imported attribute is callable, it is called \
+            with no arguments to create the element.
+
+    Returns:
+        A lazy element, which can be used as the `element` of a `route`.
+    """
+    return LazyElement(source)
+
+
+_UNRESOLVED: Any = object()
+
+
+class LazyElement:
+    """A route element that is created the first time its route is matched, and then reused."""
+
+    __slots__ = ("_element", "_lock", "source")
+
+    def __init__(self, source: str | Callable[[], Any]) -> None:
+        if isinstance(source, str) and ":" not in source:
+            msg = f"Lazy import strings must use the format 'module:attribute', got {source!r}."
+            raise ValueError(msg)
+        self.source = source
+        self._element: Any = _UNRESOLVED
+        self._lock = threading.Lock()
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the element has already been created."""
+        return self._element is not _UNRESOLVED
+
+    def resolve(self) -> Any:
+        """Import and/or create the element if needed, and return it."""
+        if self._element is _UNRESOLVED:
+            with self._lock:
+                if self._element is _UNRESOLVED:
+                    target = self.source
+                    if isinstance(target, str):
+                        module_name, attribute = target.split(":", 1)
+                        target = import_module(module_name)
+                        for name in attribute.split("."):
+                            target = getattr(target, name)
+                    self._element = target() if callable(target) else target
+        return self._element
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.source!r})"
 
 
 def navigate(to: str | int, replace: bool = False, key: Key | None = None) -> Component:
@@ -105,10 +262,13 @@ def navigate(to: str | int, replace: bool = False, key: Key | None = None) -> Co
 @component
 def _navigate(to: str | int, replace: bool = False) -> VdomDict | None:
     location = use_connection().location
-    set_location = _use_route_state().set_location
+    route_state = _use_route_state()
 
     def on_navigate_callback(_event: dict[str, Any]) -> None:
-        set_location(Location(**_event))
+        if route_state.on_client_location is None:
+            route_state.set_location(Location(_event["path"], _event["query_string"]))
+        else:
+            route_state.on_client_location(_event)
 
     if isinstance(to, int):
         # Integer navigation (go back/forward) — always delegate to JS;
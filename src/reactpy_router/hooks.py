@@ -1,17 +1,73 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-from urllib.parse import parse_qs
+from collections.abc import Mapping
+from types import MappingProxyType, UnionType
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin, get_type_hints
+from urllib.parse import parse_qs, parse_qsl, urlencode
 
-from reactpy import create_context, use_context, use_location
+from reactpy import create_context, use_context, use_effect, use_location, use_state
 
-from reactpy_router.types import RouteState  # noqa: TC001
+from reactpy_router.types import Navigation, RouteState
 
 if TYPE_CHECKING:
-    from reactpy.types import Context
+    from collections.abc import Callable
+
+    from reactpy.types import Context, Location
+
+    from reactpy_router.types import SearchParamsSchema
 
 
 _route_state_context: Context[RouteState | None] = create_context(None)
+_outlet_context: Context[Any] = create_context(None)
+_loader_data_context: Context[Any] = create_context(None)
+_navigation_context: Context[Navigation | None] = create_context(None)
+
+
+class SearchParamsStore:
+    """The current query string of a router, which can be changed without re-rendering the whole router.
+
+    Components that read the query string subscribe to this store, so only those components are
+    re-rendered when it is changed via `use_set_search_params`."""
+
+    def __init__(self, location: Location) -> None:
+        self.location = location
+        self.query_string = location.query_string
+        self.modified = False
+        """Whether the query string was changed since the router's location was last updated. This stays \
+        True if the query string is changed back to the location's, since the browser's URL must still be synced."""
+        self._subscribers: set[Callable[[], None]] = set()
+
+    def sync(self, location: Location) -> None:
+        """Reset the query string if the router's location has changed. Subscribers are not notified,
+        since the router re-renders all of them when its location changes."""
+        if location != self.location:
+            self.location = location
+            self.query_string = location.query_string
+            self.modified = False
+
+    def set(self, query_string: str) -> None:
+        """Change the query string, and notify every subscriber if it is different."""
+        if query_string != self.query_string:
+            self.query_string = query_string
+            self.modified = True
+            for subscriber in tuple(self._subscribers):
+                subscriber()
+
+    def subscribe(self, subscriber: Callable[[], None]) -> Callable[[], None]:
+        """Call `subscriber` whenever the query string changes. Returns a function that unsubscribes it."""
+        self._subscribers.add(subscriber)
+        return lambda: self._subscribers.discard(subscriber)
+
+
+def _use_search_params_store(store: SearchParamsStore | None) -> None:
+    """Re-render the current component whenever the given search params store changes."""
+    _, set_version = use_state(0)
+
+    @use_effect(dependencies=[store])
+    def subscribe() -> Callable[[], None] | None:
+        if store is None:
+            return None
+        return store.subscribe(lambda: set_version(lambda version: version + 1))
 
 
 def _use_route_state() -> RouteState:
@@ -41,34 +97,190 @@ def use_params() -> dict[str, Any]:
     return _use_route_state().params
 
 
+def use_outlet() -> Any:
+    """This hook returns the element of the matched child route, for use within the element of a \
+    layout route (see the `layout` parameter of `route`).
+
+    Returns:
+        The matched child route's element, or None if the layout route itself was matched.
+    """
+
+    return use_context(_outlet_context)
+
+
+def use_navigation() -> Navigation:
+    """This hook returns the navigation state of the router, which can be used to show progress while \
+    a newly matched route's data is being loaded (see the `loader` parameter of `route`).
+
+    While the new route's data is loading, the previous route stays rendered and its components are \
+    re-rendered with a "loading" state. Loading is cancelled if another navigation starts before it finishes.
+
+    Returns:
+        The router's navigation state.
+    """
+
+    navigation = use_context(_navigation_context)
+    location = use_location()
+    return Navigation("idle", location) if navigation is None else navigation
+
+
+def use_loader_data() -> Any:
+    """This hook returns the data loaded by the `loader` of the current route. If the current route \
+    doesn't have a loader, the data of its nearest parent route with a loader is returned instead.
+
+    Routes with loaders are only rendered once their data (and the data of their parents) has been loaded.
+
+    Returns:
+        The data returned by the route's loader, or None if neither the route nor its parents have a loader.
+
+    Raises:
+        Exception: The exception raised by the route's loader, if it failed.
+    """
+
+    data = use_context(_loader_data_context)
+    if isinstance(data, Exception):
+        raise data
+    return data
+
+
 def use_search_params(
     keep_blank_values: bool = False,
     strict_parsing: bool = False,
     errors: str = "replace",
     max_num_fields: int | None = None,
     separator: str = "&",
-) -> dict[str, list[str]]:
+    schema: SearchParamsSchema | None = None,
+) -> Mapping[str, Any]:
     """
     This hook is used to read the query string in the URL for the current location.
 
     See [`urllib.parse.parse_qs`](https://docs.python.org/3/library/urllib.parse.html#urllib.parse.parse_qs) \
         for info on this hook's parameters.
 
+    Within a router, the query string can be changed with `use_set_search_params`. The parsed query \
+    string is cached, so it is only parsed again when the query string (or the parsing options) \
+    change. It is shared by every component that uses the same options, so each component receives \
+    a read-only mapping with its own copies of any lists.
+
+    Args:
+        schema: An optional mapping (or a class with type annotations, such as a `TypedDict`) of \
+            parameter names to types, such as `{"page": int, "tags": list[str]}`. If provided, only \
+            these parameters are returned. `list` and `list[...]` types receive every value of a \
+            parameter, while other types (including optional types, such as `int | None`) receive its \
+            first value. Parameters that are missing, or that can't be \
+            converted to their type, are left out.
+
     Returns:
-        A dictionary of the current URL's query string parameters.
+        A read-only mapping of the current URL's query string parameters.
     """
     location = use_location()
-    query_string = location.query_string[1:] if len(location.query_string) > 1 else ""
-
-    # TODO: In order to match `react-router`, this will need to return a tuple of the search params \
-    # and a function to update them. This is currently not possible without reactpy core having a \
-    # communication layer.
-    # https://github.com/reactive-python/reactpy/issues/975
-    return parse_qs(
-        query_string,
-        keep_blank_values=keep_blank_values,
-        strict_parsing=strict_parsing,
-        errors=errors,
-        max_num_fields=max_num_fields,
-        separator=separator,
-    )
+    route_state = use_context(_route_state_context)
+    store = None if route_state is None else route_state.search_params
+    _use_search_params_store(store)
+    query_string = location.query_string if store is None else store.query_string
+    query_string = query_string[1:] if len(query_string) > 1 else ""
+    fields = _schema_fields(schema)
+
+    def parse() -> Mapping[str, Any]:
+        params = parse_qs(
+            query_string,
+            keep_blank_values=keep_blank_values,
+            strict_parsing=strict_parsing,
+            errors=errors,
+            max_num_fields=max_num_fields,
+            separator=separator,
+        )
+        return MappingProxyType(params if fields is None else _convert_search_params(params, fields))
+
+    cache = None if route_state is None else route_state.search_params_cache
+    if cache is None:
+        return parse()
+
+    key = (query_string, keep_blank_values, strict_parsing, errors, max_num_fields, separator, fields)
+    search_params = cache.get(key)
+    if search_params is None:
+        search_params = cache.set(key, parse())
+    # Lists are copied, so that a component modifying them can't change what other components see
+    return MappingProxyType({
+        name: list(value) if isinstance(value, list) else value for name, value in search_params.items()
+    })
+
+
+def _schema_fields(schema: SearchParamsSchema | None) -> tuple[tuple[str, Any], ...] | None:
+    """Get the (hashable) fields of a search params schema."""
+    if schema is None:
+        return None
+    if isinstance(schema, Mapping):
+        return tuple(schema.items())
+    return tuple(get_type_hints(schema).items())
+
+
+def _convert_search_params(params: dict[str, list[str]], fields: tuple[tuple[str, Any], ...]) -> dict[str, Any]:
+    """Convert parsed query string parameters to the types of a search params schema."""
+    converted: dict[str, Any] = {}
+    for name, field_type in fields:
+        values = params.get(name)
+        if not values:
+            continue
+        # Optional (and other union) types are converted to their first member that accepts the value
+        for member_type in _union_members(field_type):
+            try:
+                if member_type is list or get_origin(member_type) is list:
+                    (item_type,) = get_args(member_type) or (str,)
+                    converted[name] = [_convert_search_param(value, item_type) for value in values]
+                else:
+                    converted[name] = _convert_search_param(values[0], member_type)
+            except (TypeError, ValueError):
+                continue
+            break
+    return converted
+
+
+def _union_members(field_type: Any) -> tuple[Any, ...]:
+    """Get the types of a union (such as `int | None`) other than None, or the type itself if it isn't a union."""
+    if get_origin(field_type) in (Union, UnionType):
+        return tuple(member for member in get_args(field_type) if member is not type(None))
+    return (field_type,)
+
+
+def _convert_search_param(value: str, param_type: Any) -> Any:
+    if param_type is bool:
+        return value.lower() in {"1", "true", "yes", "on"}
+    return param_type(value)
+
+
+def use_set_search_params() -> Callable[[Mapping[str, Any]], None]:
+    """
+    This hook returns a function that changes the query string in the URL for the current location.
+
+    The function accepts a mapping of parameter names to new values, which is merged into the current \
+    query string. A value can be a string (or any other object, which is converted to a string), a list of \
+    values, or None to remove the parameter.
+
+    The browser's URL is updated via `history.replaceState`, so no history entry is created. Only the \
+    components that use `use_search_params` are re-rendered, and several changes made within the same \
+    event are sent to the browser as one update.
+
+    Returns:
+        A function that changes the current URL's query string parameters.
+    """
+    store = _use_route_state().search_params
+    if store is None:  # pragma: no cover
+        msg = "This router does not support changing search params."
+        raise RuntimeError(msg)
+
+    def set_search_params(changes: Mapping[str, Any]) -> None:
+        params: dict[str, list[str]] = {}
+        for name, value in parse_qsl(store.query_string[1:], keep_blank_values=True):
+            params.setdefault(name, []).append(value)
+        for name, value in changes.items():
+            if value is None:
+                params.pop(name, None)
+            elif isinstance(value, (list, tuple)):
+                params[name] = [str(item) for item in value]
+            else:
+                params[name] = [str(value)]
+        query_string = urlencode(params, doseq=True)
+        store.set(f"?{query_string}" if query_string else "")
+
+    return set_search_params
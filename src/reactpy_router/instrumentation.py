@@ -0,0 +1,157 @@
+"""Instrumentation that records the routing work performed by routers."""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from reactpy_router.types import CompileEvent, MatchEvent
+
+__all__ = ["RouteStats"]
+
+
+class RouteStats:
+    """Collects routing statistics from one or more routers.
+
+    This implements the `RouterInstrumentation` protocol, and can be passed to `create_router`:
+
+    ```python
+    stats = RouteStats()
+    instrumented_router = create_router(ReactPyResolver, instrumentation=stats)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def on_match(self, event: MatchEvent) -> None:
+        with self._lock:
+            self._matches["hit" if event.key is not None else "miss"] += 1
+            self._match_seconds += event.duration
+            self._match_max_seconds = max(self._match_max_seconds, event.duration)
+            self._routes_tried += event.routes_tried
+            self._cache["hit" if event.cache_hit else "miss"] += 1
+            if event.key is not None:
+                self._route_matches[str(event.key)] += 1
+
+    def on_compile(self, event: CompileEvent) -> None:
+        with self._lock:
+            self._compiles[event.resolver] += 1
+            self._compile_seconds[event.resolver] += event.duration
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get a snapshot of the statistics collected so far.
+
+        Returns:
+            A dictionary of routing statistics, which is safe to modify or serialize as JSON.
+        """
+        with self._lock:
+            lookups = self._matches.total()
+            return {
+                "matches": {"hit": self._matches["hit"], "miss": self._matches["miss"], "total": lookups},
+                "match_seconds": {
+                    "total": self._match_seconds,
+                    "average": self._match_seconds / lookups if lookups else 0.0,
+                    "max": self._match_max_seconds,
+                },
+                "routes_tried": {
+                    "total": self._routes_tried,
+                    "average": self._routes_tried / lookups if lookups else 0.0,
+                },
+                "match_cache": dict(self._cache),
+                "route_matches": dict(self._route_matches),
+                "compiles": {
+                    resolver: {"count": count, "seconds": self._compile_seconds[resolver]}
+                    for resolver, count in self._compiles.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """Discard all of the statistics collected so far."""
+        with self._lock:
+            self._matches: Counter[str] = Counter()
+            self._match_seconds = 0.0
+            self._match_max_seconds = 0.0
+            self._routes_tried = 0
+            self._cache = Counter({"hit": 0, "miss": 0})
+            self._route_matches: Counter[str] = Counter()
+            self._compiles: Counter[str] = Counter()
+            self._compile_seconds: defaultdict[str, float] = defaultdict(float)
+
+    def to_prometheus(self, prefix: str = "reactpy_router") -> str:
+        """
+        Render the statistics in the Prometheus text exposition format.
+
+        Args:
+            prefix: The prefix used for every metric name.
+
+        Returns:
+            The metrics, which can be served from a `/metrics` endpoint.
+        """
+        stats = self.get_stats()
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: list[tuple[str, dict[str, str], float]]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(f'{label}="{_escape_label(text)}"' for label, text in labels.items())
+                lines.append(
+                    f"{prefix}_{name}{suffix}{{{label_text}}} {value}" if labels else f"{prefix}_{name}{suffix} {value}"
+                )
+
+        metric(
+            "matches_total",
+            "counter",
+            "Number of route lookups, by whether a route matched.",
+            [("", {"result": result}, stats["matches"][result]) for result in ("hit", "miss")],
+        )
+        metric(
+            "match_duration_seconds",
+            "summary",
+            "Time spent resolving paths.",
+            [
+                ("_sum", {}, stats["match_seconds"]["total"]),
+                ("_count", {}, stats["matches"]["total"]),
+            ],
+        )
+        metric(
+            "routes_tried_total",
+            "counter",
+            "Number of routes tried while resolving paths.",
+            [("", {}, stats["routes_tried"]["total"])],
+        )
+        metric(
+            "match_cache_total",
+            "counter",
+            "Number of route lookups, by whether they were served from the match cache.",
+            [("", {"result": result}, count) for result, count in stats["match_cache"].items()],
+        )
+        metric(
+            "route_matches_total",
+            "counter",
+            "Number of times each route was matched.",
+            [("", {"key": key}, count) for key, count in stats["route_matches"].items()],
+        )
+        metric(
+            "compile_duration_seconds",
+            "summary",
+            "Time spent compiling route tables, by resolver.",
+            [
+                sample
+                for resolver, compiles in stats["compiles"].items()
+                for sample in (
+                    ("_sum", {"resolver": resolver}, compiles["seconds"]),
+                    ("_count", {"resolver": resolver}, compiles["count"]),
+                )
+            ],
+        )
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
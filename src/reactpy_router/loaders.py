@@ -0,0 +1,112 @@
+"""A process-wide cache for the results of route loaders, which is shared by every connection."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+from reactpy_router.types import CacheInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+    from reactpy_router.types import RouteLoader
+
+__all__ = ["LoaderCache", "loader_cache"]
+
+_logger = getLogger(__name__)
+
+
+class LoaderCache:
+    """A size-bounded cache of route loader results, with a TTL and stale-while-revalidate.
+
+    Results are keyed by their loader, the full path of its route, and the converted parameters of the
+    matched path. A result is fresh for `ttl` seconds, and is then served as stale for another `stale_ttl`
+    seconds while a single background refresh replaces it. Concurrent lookups for a missing result share
+    one fetch, so a loader is never called twice for the same key at once. Failed fetches aren't cached.
+
+    This can be passed to `create_router`:
+
+    ```python
+    cached_router = create_router(ReactPyResolver, loader_cache=loader_cache)
+    ```
+
+    Since loaders only receive the parameters of the matched path, their results are shared between every
+    connection that uses the cache. Don't use it for routes whose data depends on who is viewing them."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0, stale_ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._fetches: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def load(self, loader: RouteLoader, path: str, params: dict[str, Any]) -> Any:
+        """
+        Get the result of a route's loader, calling the loader if no fresh or stale result is cached.
+
+        Args:
+            loader: The route's loader.
+            path: The full path of the loader's route.
+            params: The converted parameters of the matched path.
+
+        Returns:
+            The loader's result.
+        """
+        key = (loader, path, tuple(sorted(params.items())))
+        cached = self._data.get(key)
+        if cached is not None:
+            age = time.monotonic() - cached[0]
+            if age < self.ttl + self.stale_ttl:
+                self._data.move_to_end(key)
+                self.hits += 1
+                if age >= self.ttl and key not in self._fetches:
+                    self._fetch(key, lambda: loader(params)).add_done_callback(_log_refresh_error)
+                return cached[1]
+            del self._data[key]
+
+        self.misses += 1
+        fetch = self._fetches.get(key) or self._fetch(key, lambda: loader(params))
+        # Shield the shared fetch, so that cancelling one waiter doesn't cancel it for the others
+        return await asyncio.shield(fetch)
+
+    def _fetch(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> asyncio.Future[Any]:
+        async def fetch() -> Any:
+            try:
+                value = await load()
+            finally:
+                del self._fetches[key]
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return value
+
+        task = self._fetches[key] = asyncio.ensure_future(fetch())
+        return task
+
+    def clear(self) -> None:
+        """Remove every result from the cache and reset its counters. Fetches in progress are kept."""
+        self._data.clear()
+        self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return a snapshot of the cache's statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _log_refresh_error(task: asyncio.Future[Any]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        _logger.error("Failed to refresh a stale loader result", exc_info=task.exception())
+
+
+loader_cache = LoaderCache()
+"""The process-wide loader cache, which can be passed to `create_router`."""
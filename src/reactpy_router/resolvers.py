@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, ClassVar
+from bisect import bisect_left
+from functools import cached_property
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from reactpy_router.converters import CONVERTERS
+from reactpy_router.tables import RouteTable
 from reactpy_router.types import MatchedRoute
 
 if TYPE_CHECKING:
-    from reactpy_router.types import ConversionInfo, ConverterMapping, Route
+    from collections.abc import Sequence
+    from typing import Self
 
-__all__ = ["ReactPyResolver"]
+    from reactpy_router.types import ConversionFunc, ConversionInfo, ConverterMapping, Route
+
+__all__ = ["AlternationResolver", "ReactPyResolver", "TrieResolver"]
 
 
 class ReactPyResolver:
@@ -19,15 +26,87 @@ class ReactPyResolver:
 
     param_pattern: str = r"{(?P<name>\w+)(?P<type>:\w+)?}"
     converters: ClassVar[dict[str, ConversionInfo]] = CONVERTERS
+    table_class: ClassVar[type[RouteTable]] = RouteTable
+    lazy_compile: ClassVar[bool] = False
+    """If True, each route's regex is only compiled the first time a path passes its literal prefix check."""
 
     def __init__(self, route: Route) -> None:
         self.element = route.element
+        self.path = route.path
         self.converter_mapping: ConverterMapping = {}
+        self.converter_types: dict[str, str] = {}
         self.param_regex = re.compile(self.param_pattern)
-        self.pattern = self.parse_path(route.path)
-        self.key = self.pattern.pattern  # Unique identifier for ReactPy rendering
+        # `parse_path` is the hook for customizing patterns, so routes are compiled eagerly when it is overridden
+        custom_pattern = _has_custom_pattern(type(self))
+        if self.lazy_compile and not custom_pattern:
+            self.pattern_source = self.build_pattern(route.path)
+            self.pattern_flags = 0
+        else:
+            self.pattern = self.parse_path(route.path)
+            self.pattern_source = self.pattern.pattern
+            # Flags other than the default `re.UNICODE` (such as `re.IGNORECASE`) from a custom pattern
+            self.pattern_flags = self.pattern.flags & ~re.UNICODE
+        self.key = self.pattern_source  # Unique identifier for ReactPy rendering
+        # Routes without parameters can be matched by `RouteTable` with a dictionary lookup, and paths that
+        # don't start with a route's leading static text can be rejected without a regex. A custom pattern
+        # may match other paths, so it is always tried.
+        self.static_path = None if self.converter_mapping or custom_pattern else route.path
+        first_param = self.param_regex.search(route.path)
+        self.prefix = "" if custom_pattern else route.path[: first_param.start()] if first_param else route.path
+
+    def dump(self) -> dict[str, Any]:
+        """
+        Serialize this compiled route, so that it can later be restored by `load` without parsing its path.
+
+        Returns:
+            A JSON serializable dictionary.
+        """
+        return {
+            "path": self.path,
+            "pattern": self.pattern_source,
+            "flags": self.pattern_flags,
+            "converters": self.converter_types,
+            "static_path": self.static_path,
+            "prefix": self.prefix,
+        }
+
+    @classmethod
+    def load(cls, data: dict[str, Any]) -> Self:
+        """
+        Restore a compiled route that was serialized by `dump`.
+
+        Args:
+            data: The serialized route.
+
+        Returns:
+            The compiled route, without an element.
+        """
+        self = cls.__new__(cls)
+        self.element = None
+        self.path = data["path"]
+        self.converter_types = data["converters"]
+        self.converter_mapping = {name: cls.converters[type_]["func"] for name, type_ in self.converter_types.items()}
+        self.param_regex = re.compile(self.param_pattern)
+        self.pattern_source = self.key = data["pattern"]
+        self.pattern_flags = data["flags"]
+        self.static_path = data["static_path"]
+        self.prefix = data["prefix"]
+        if not cls.lazy_compile:
+            self.pattern = re.compile(self.pattern_source, self.pattern_flags)
+        return self
+
+    @cached_property
+    def pattern(self) -> re.Pattern[str]:
+        """The compiled regex for this route. When `lazy_compile` is enabled, this is compiled on first use."""
+        return re.compile(self.pattern_source, self.pattern_flags)
 
     def parse_path(self, path: str) -> re.Pattern[str]:
+        """Compile a route's path into a regex. Subclasses can override this to customize their patterns, \
+        although routes are then compiled eagerly, even if `lazy_compile` is enabled."""
+        return re.compile(self.build_pattern(path))
+
+    def build_pattern(self, path: str) -> str:
+        """Convert a route's path into the source of its regex, and register the converters of its parameters."""
         # Convert path to regex pattern, then interpret using registered converters
         pattern = "^"
         last_match_end = 0
@@ -59,6 +138,7 @@ class ReactPyResolver:
 
             # Keep a local mapping of the URL's parameter names to conversion functions.
             self.converter_mapping[name] = conversion_info["func"]
+            self.converter_types[name] = param_type
 
             # Update the last match end
             last_match_end = match.end()
@@ -66,9 +146,11 @@ class ReactPyResolver:
         # Add the string after the last match
         pattern += f"{re.escape(path[last_match_end:])}$"
 
-        return re.compile(pattern)
+        return pattern
 
     def resolve(self, path: str) -> MatchedRoute | None:
+        if not path.startswith(self.prefix):
+            return None
         match = self.pattern.match(path)
         if match:
             # Convert the matched groups to the correct types
@@ -78,3 +160,265 @@ class ReactPyResolver:
             }
             return MatchedRoute(self.element, params, path)
         return None
+
+
+class _ParamSegment:
+    __slots__ = ("multi_segment", "name", "pattern", "type")
+
+    def __init__(self, name: str, param_type: str, pattern: re.Pattern[str], multi_segment: bool) -> None:
+        self.name = name
+        self.type = param_type
+        self.pattern = pattern
+        self.multi_segment = multi_segment
+
+
+class _TrieNode:
+    __slots__ = ("dynamic", "min_index", "static", "terminal", "trailing")
+
+    def __init__(self) -> None:
+        self.static: dict[str, _TrieNode] = {}
+        self.dynamic: dict[tuple[str, str], tuple[_ParamSegment, _TrieNode]] = {}
+        self.trailing: list[tuple[int, _ParamSegment]] = []
+        self.terminal: int | None = None
+        self.min_index: float = float("inf")
+
+
+class TrieRouteTable(RouteTable):
+    """A route table that walks the path one `/`-separated segment at a time.
+
+    Every branch that could still produce an earlier declared route is explored, so the first
+    declared route that matches the path always wins (the same as a linear scan)."""
+
+    routes: tuple[TrieResolver, ...]
+
+    def __init__(self, routes: Sequence[TrieResolver], match_cache_size: int | None = None) -> None:
+        super().__init__(routes, match_cache_size)
+        self.root = _TrieNode()
+        self.fallback: list[tuple[int, TrieResolver]] = []
+
+        for index, compiled_route in enumerate(self.routes):
+            if compiled_route.segments is None:
+                self.fallback.append((index, compiled_route))
+            else:
+                self._insert(index, compiled_route.segments)
+
+        if self.routes:
+            type_priority = type(self.routes[0]).type_priority
+            self._sort_dynamic(self.root, {param_type: order for order, param_type in enumerate(type_priority)})
+
+    def _insert(self, index: int, segments: Sequence[str | _ParamSegment]) -> None:
+        node = self.root
+        node.min_index = min(node.min_index, index)
+        for segment in segments:
+            if isinstance(segment, str):
+                node = node.static.setdefault(segment, _TrieNode())
+            elif segment.multi_segment:
+                node.trailing.append((index, segment))
+                return
+            else:
+                _, node = node.dynamic.setdefault((segment.type, segment.name), (segment, _TrieNode()))
+            node.min_index = min(node.min_index, index)
+
+        if node.terminal is None:
+            node.terminal = index
+
+    def _sort_dynamic(self, node: _TrieNode, priority: dict[str, int]) -> None:
+        ordered = sorted(node.dynamic.items(), key=lambda item: priority.get(item[0][0], len(priority)))
+        node.dynamic = dict(ordered)
+        for child in node.static.values():
+            self._sort_dynamic(child, priority)
+        for _, child in node.dynamic.values():
+            self._sort_dynamic(child, priority)
+
+    def match(self, path: str) -> tuple[int, MatchedRoute] | None:
+        best_index, raw_params = self._walk(self.root, path.split("/"), 0, {}, len(self.routes), None)
+
+        for index, compiled_route in self.fallback:
+            if index >= best_index:
+                break
+            match = compiled_route.resolve(path)
+            if match is not None:
+                return index, match
+
+        if raw_params is None:
+            return None
+
+        compiled_route = self.routes[best_index]
+        converters = compiled_route.converter_mapping
+        params = {name.removeprefix("_numeric_"): converters[name](value) for name, value in raw_params.items()}
+        return best_index, MatchedRoute(compiled_route.element, params, path)
+
+    def attempts(self, index: int | None) -> int:
+        # One walk of the trie, plus any regex routes that were declared before the result
+        if index is None:
+            return 1 + len(self.fallback)
+        return 1 + bisect_left(self.fallback, index, key=itemgetter(0))
+
+    def _walk(
+        self,
+        node: _TrieNode,
+        parts: list[str],
+        depth: int,
+        params: dict[str, str],
+        best_index: int,
+        best_params: dict[str, str] | None,
+    ) -> tuple[int, dict[str, str] | None]:
+        if node.min_index >= best_index:
+            return best_index, best_params
+
+        if depth == len(parts):
+            if node.terminal is not None and node.terminal < best_index:
+                return node.terminal, dict(params)
+            return best_index, best_params
+
+        part = parts[depth]
+        child = node.static.get(part)
+        if child is not None:
+            best_index, best_params = self._walk(child, parts, depth + 1, params, best_index, best_params)
+
+        for segment, child in node.dynamic.values():
+            if child.min_index < best_index and segment.pattern.fullmatch(part):
+                params[segment.name] = part
+                best_index, best_params = self._walk(child, parts, depth + 1, params, best_index, best_params)
+                del params[segment.name]
+
+        for index, segment in node.trailing:
+            if index >= best_index:
+                break
+            remainder = "/".join(parts[depth:])
+            if segment.pattern.fullmatch(remainder):
+                return index, {**params, segment.name: remainder}
+
+        return best_index, best_params
+
+
+class TrieResolver(ReactPyResolver):
+    """URL resolver that is matched through a segment trie instead of a linear scan of every route.
+
+    Uses the same routing syntax as `ReactPyResolver`. Static segments are matched with a dictionary
+    lookup, and typed segments are tried in `type_priority` order. A route whose segments can't be
+    represented within the trie (such as `/file-{id:int}.txt`) is matched with its regex instead."""
+
+    type_priority: ClassVar[tuple[str, ...]] = ("int", "slug", "uuid")
+    """Parameter types that are tried first (in this order) when a segment has no static match."""
+    multi_segment_types: ClassVar[frozenset[str]] = frozenset({"path", "any"})
+    """Parameter types that can span multiple segments. These are only supported as the final segment."""
+    table_class: ClassVar[type[RouteTable]] = TrieRouteTable
+
+    def __init__(self, route: Route) -> None:
+        super().__init__(route)
+        # A customized `parse_path` may match paths differently, so those routes are matched via their regex
+        self.segments = None if _has_custom_pattern(type(self)) else self.parse_segments(route.path)
+
+    @classmethod
+    def load(cls, data: dict[str, Any]) -> Self:
+        self = super().load(data)
+        self.segments = None if _has_custom_pattern(cls) else self.parse_segments(self.path)
+        return self
+
+    def parse_segments(self, path: str) -> tuple[str | _ParamSegment, ...] | None:
+        """Split a path into static segments and parameter segments, or return None if the
+        path can't be represented within a segment trie."""
+        segments: list[str | _ParamSegment] = []
+        parts = path.split("/")
+
+        for position, part in enumerate(parts):
+            match = self.param_regex.fullmatch(part)
+            if match is None:
+                if self.param_regex.search(part):
+                    # Segments that mix static text and parameters must be matched via regex
+                    return None
+                segments.append(part)
+                continue
+
+            name = match.group("name")
+            if name[0].isnumeric():
+                name = f"_numeric_{name}"
+            param_type = (match.group("type") or "str").strip(":")
+            multi_segment = param_type in self.multi_segment_types
+            if multi_segment and position != len(parts) - 1:
+                return None
+
+            conversion_info = self.converters[param_type]
+            segments.append(_ParamSegment(name, param_type, re.compile(conversion_info["regex"]), multi_segment))
+
+        return tuple(segments)
+
+
+class AlternationRouteTable(RouteTable):
+    """A route table that combines every route into a single alternation regex.
+
+    Each route becomes a named branch (`(?P<r0>...)|(?P<r1>...)`) and its parameter groups are renamed so
+    they don't clash with other routes. Since regex alternation tries branches in order, the first declared
+    route that matches the path wins."""
+
+    routes: tuple[ReactPyResolver, ...]
+    group_pattern: str = r"\(\?P([<=])(\w+)"
+
+    def __init__(self, routes: Sequence[ReactPyResolver], match_cache_size: int | None = None) -> None:
+        super().__init__(routes, match_cache_size)
+        self.dispatch: dict[str, tuple[int, tuple[tuple[str, str, ConversionFunc], ...]]] = {}
+        group_regex = re.compile(self.group_pattern)
+        branches: list[str] = []
+
+        for index, compiled_route in enumerate(self.routes):
+            branch_name = f"r{index}"
+            body = group_regex.sub(rf"(?P\g<1>{branch_name}_\g<2>", compiled_route.pattern_source)
+            # The flags of a customized pattern (such as `re.IGNORECASE`) are scoped to its own branch
+            flags = compiled_route.pattern_flags
+            if flags & ~_ALL_INLINE_FLAGS:
+                # Other flags can't be scoped to a branch, so every route is matched with its own regex instead
+                self.pattern = None
+                return
+            inline_flags = "".join(letter for flag, letter in _INLINE_FLAGS.items() if flags & flag)
+            if inline_flags:
+                body = f"(?{inline_flags}:{body})"
+            branches.append(f"(?P<{branch_name}>{body})")
+            self.dispatch[branch_name] = (
+                index,
+                tuple(
+                    (f"{branch_name}_{name}", name.removeprefix("_numeric_"), func)
+                    for name, func in compiled_route.converter_mapping.items()
+                ),
+            )
+
+        self.pattern: re.Pattern[str] | None = re.compile("|".join(branches))
+
+    def match(self, path: str) -> tuple[int, MatchedRoute] | None:
+        if self.pattern is None:
+            return super().match(path)
+        match = self.pattern.match(path)
+        if match is None or match.lastgroup is None:
+            return None
+
+        # The route's branch group encloses all of its parameter groups, so it is always the last to close
+        index, params = self.dispatch[match.lastgroup]
+        return index, MatchedRoute(
+            self.routes[index].element,
+            {name: func(match.group(group)) for group, name, func in params},
+            path,
+        )
+
+    def attempts(self, index: int | None) -> int:
+        if self.pattern is None:
+            return super().attempts(index)
+        # Every route is tried within a single regex scan
+        return 1
+
+
+class AlternationResolver(ReactPyResolver):
+    """URL resolver that is matched through a single alternation regex of every route.
+
+    Uses the same routing syntax as `ReactPyResolver`, but replaces one Python-level regex match per
+    route with a single regex scan for the whole route table."""
+
+    table_class: ClassVar[type[RouteTable]] = AlternationRouteTable
+
+
+_INLINE_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s", re.VERBOSE: "x"}
+_ALL_INLINE_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE
+
+
+def _has_custom_pattern(resolver: type[ReactPyResolver]) -> bool:
+    """Check whether a resolver customizes its patterns by overriding `parse_path`."""
+    return resolver.parse_path is not ReactPyResolver.parse_path
@@ -2,32 +2,92 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import OrderedDict, deque
+from copy import copy
 from dataclasses import replace
+from itertools import count
 from logging import getLogger
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
-from reactpy import component, use_connection, use_memo, use_state
+from reactpy import component, html, use_async_effect, use_connection, use_memo, use_ref, use_state
 from reactpy.core.hooks import ConnectionContext
 from reactpy.types import Component, Connection, Location, VdomDict
 
-from reactpy_router.components import History
-from reactpy_router.hooks import RouteState, _route_state_context
+from reactpy_router.components import (
+    ROUTER_ATTRIBUTE,
+    History,
+    LazyElement,
+    LinkListener,
+    ReplaceLocation,
+    ReplaceSearch,
+)
+from reactpy_router.hooks import (
+    RouteState,
+    SearchParamsStore,
+    _loader_data_context,
+    _navigation_context,
+    _outlet_context,
+    _route_state_context,
+    _use_search_params_store,
+)
 from reactpy_router.resolvers import ReactPyResolver
+from reactpy_router.tables import LRUCache, table_cache, tree_fingerprint
+from reactpy_router.types import MatchEvent, Navigation
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Callable, Coroutine, Iterator, Mapping, Sequence
 
-    from reactpy_router.types import CompiledRoute, MatchedRoute, Resolver, Route, Router
+    from reactpy import Ref
+    from reactpy.types import Key
+
+    from reactpy_router.loaders import LoaderCache
+    from reactpy_router.tables import RouteTable
+    from reactpy_router.types import MatchedRoute, Resolver, Route, RouteLoader, Router, RouterInstrumentation
 
 __all__ = ["browser_router", "create_router"]
 _logger = getLogger(__name__)
+_T = TypeVar("_T")
+
+_router_ids = count()
+
+MAX_REDIRECTS = 10
+"""The maximum number of redirect routes that are followed while resolving a single location."""
+
 
+def create_router(
+    resolver: Resolver[Route],
+    instrumentation: RouterInstrumentation | None = None,
+    keep_alive: int = 0,
+    loader_cache: LoaderCache | None = None,
+) -> Router[Route]:
+    """A decorator that turns a resolver into a router
 
-def create_router(resolver: Resolver[Route]) -> Router[Route]:
-    """A decorator that turns a resolver into a router"""
+    Args:
+        resolver: The resolver used to compile each route.
+        instrumentation: An optional object that is notified about the routing work performed by the \
+            router, such as `reactpy_router.instrumentation.RouteStats`. When this is not provided, no \
+            measurements are taken.
+        keep_alive: The number of recently matched routes that stay mounted (but hidden) after navigating \
+            away from them, so that returning to them doesn't rebuild their component tree. The least \
+            recently matched route is unmounted when this limit is reached. Defaults to 0 (disabled).
+        loader_cache: An optional cache for the results of route loaders, such as \
+            `reactpy_router.loaders.loader_cache`, which is shared by every connection that uses it. When \
+            this is not provided, each connection calls its route loaders itself.
+
+    Returns:
+        A router that renders the given routes.
+    """
 
     def wrapper(*routes: Route) -> Component:
-        return router(*routes, resolver=resolver)
+        return router(
+            *routes,
+            resolver=resolver,
+            instrumentation=instrumentation,
+            keep_alive=keep_alive,
+            loader_cache=loader_cache,
+        )
 
     return wrapper
 
@@ -53,6 +113,9 @@ def browser_router(*routes: Route) -> Component:
 def router(
     *routes: Route,
     resolver: Resolver[Route],
+    instrumentation: RouterInstrumentation | None = None,
+    keep_alive: int = 0,
+    loader_cache: LoaderCache | None = None,
 ) -> VdomDict | None:
     """A component that renders matching route using the given resolver.
 
@@ -61,13 +124,42 @@ def router(
 
     initial = use_connection()
     location, set_location = use_state(initial.location)
-    resolvers = use_memo(
-        lambda: tuple(map(resolver, _iter_routes(routes))),
-        dependencies=(resolver, hash(routes)),
+    last_sequence = use_ref(0)
+    # Links are handled by the nearest router that contains them, which is found via this ID
+    router_id = use_memo(lambda: str(next(_router_ids)), dependencies=())
+    search_params_cache = use_memo(lambda: LRUCache(maxsize=16), dependencies=())
+    search_params = use_memo(lambda: SearchParamsStore(location or initial.location), dependencies=())
+    kept_routes = use_memo(lambda: _KeptRoutes(keep_alive), dependencies=(keep_alive,))
+    prefetches = use_memo(_Prefetches, dependencies=())
+    # The table only depends on the structure of the routes, so it is reused when new elements are rendered
+    table, positions = use_memo(
+        lambda: _compile_routes(resolver, routes, instrumentation),
+        dependencies=(resolver, tree_fingerprint(routes)),
     )
-    match = use_memo(lambda: _match_route(resolvers, location or initial.location))
-
-    if match:
+    # Routes with loaders are only rendered once their data has been loaded for the current location
+    loaded, set_loaded = use_state(cast("tuple[Location, dict[str, Any]] | None", None))
+    current_location = location or initial.location
+    loader_data = loaded[1] if loaded is not None and loaded[0] == current_location else None
+    result = _resolve_route(table, positions, routes, current_location, instrumentation, loader_data)
+    loaders = result[2] if result else ()
+    # Redirect routes are resolved on the server, so the browser's URL only needs to be replaced afterwards
+    resolved_location = result[3] if result else current_location
+    search_params.sync(resolved_location)
+    last_content: Ref[Any] = use_ref(None)
+
+    # The in-flight work of the current navigation, which is cancelled as soon as a newer navigation starts
+    navigation_tasks = use_memo(_NavigationTasks, dependencies=())
+    shown_location = use_ref(resolved_location)
+
+    @use_async_effect(dependencies=[current_location, tuple(path for path, _ in loaders)])
+    async def load_route_data() -> None:
+        navigation_tasks.cancel()
+        if loaders and result:
+            data = await navigation_tasks.run(_run_loaders(loaders, result[1].params, loader_cache))
+            set_loaded((current_location, data))
+
+    if result:
+        key, match, _, _ = result
         if not location or not location.path:
             msg = (
                 "ReactPy-Router was unable to determine the current URL location.\n"
@@ -75,50 +167,368 @@ def router(
             )
             raise RuntimeError(msg)
 
-        def on_history_previous(event: dict[str, Any]) -> None:
-            """Callback function used within the JavaScript `History` component that signifies
-            a history "go back" action."""
-            new_location = Location(**event)
-            if location != new_location:
+        def on_client_location(event: dict[str, Any]) -> None:
+            """Callback function used within the JavaScript `History`, `LinkListener`, and `Navigate`
+            components that signifies the browser's URL has changed.
+
+            Every event is tagged with a sequence number by the client, so navigations that were superseded
+            by a newer one are dropped. Since only the newest location is kept, navigations received before
+            the next render are coalesced into a single render."""
+            if _accept_sequenced_event(event, last_sequence):
+                new_location = Location(**event)
+                if new_location != current_location:
+                    navigation_tasks.cancel()
                 set_location(new_location)
+                # The query string may have been changed without changing the router's location
+                search_params.set(new_location.query_string)
+
+        def on_prefetch(event: dict[str, Any]) -> None:
+            """Callback function used within the JavaScript `LinkListener` component when a link with a
+            `prefetch` attribute is hovered or becomes visible. This imports the link's lazy elements and
+            warms the loader cache for its route."""
+            if not prefetches.accept(event["path"]):
+                return
+            try:
+                prefetched = _resolve_route(table, positions, routes, Location(event["path"], event["query_string"]))
+            except Exception:
+                # Prefetching is only an optimization, so a path that can't be resolved is treated as a miss
+                _logger.exception("Failed to prefetch %s", event["path"])
+                return
+            if prefetched and prefetched[2] and loader_cache is not None:
+                prefetches.start(_run_loaders(prefetched[2], prefetched[1].params, loader_cache))
+
+        def route_state(match: MatchedRoute) -> RouteState:
+            return RouteState(set_location, match.params, on_client_location, search_params_cache, search_params)
+
+        if loaders and loader_data is None:
+            # Keep showing the previous route while the new route's data is loading
+            navigation = Navigation("loading", shown_location.current, resolved_location)
+            content = last_content.current
+        else:
+            navigation = Navigation("idle", resolved_location)
+            shown_location.current = resolved_location
+            if keep_alive:
+                kept_routes.add(key, match, resolved_location)
+                content = last_content.current = kept_routes.render(key, initial, route_state)
+            else:
+                content = last_content.current = _route_state_context(match.element, value=route_state(match))
 
         return ConnectionContext(
-            History({"onHistoryPreviousCallback": on_history_previous}),  # type: ignore[return-value]
-            _route_state_context(match.element, value=RouteState(set_location, match.params)),
-            value=Connection(initial.scope, location or initial.location, initial.carrier),
+            History({"onHistoryPreviousCallback": on_client_location}),  # type: ignore[return-value]
+            LinkListener({
+                "routerId": router_id,
+                "onClickCallback": on_client_location,
+                "onPrefetchCallback": on_prefetch,
+            }),
+            _search_params_sync(search_params),
+            html.div(
+                {ROUTER_ATTRIBUTE: router_id, "style": {"display": "contents"}},
+                _navigation_context(content, value=navigation),
+            ),
+            _replace_location(current_location, resolved_location, last_sequence.current),
+            value=Connection(initial.scope, resolved_location, initial.carrier),
         )
 
     return None
 
 
-def _iter_routes(routes: Sequence[Route]) -> Iterator[Route]:
-    for parent in routes:
-        for child in _iter_routes(parent.routes):
-            yield replace(child, path=parent.path + child.path)  # type: ignore[misc]
-        yield parent
+class _KeptRoutes:
+    """The most recently matched routes of a keep-alive router, which stay mounted while they are hidden.
+
+    Routes are identified by their compiled key, so matching the same route with different parameters
+    updates its entry rather than adding a new one."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        # Entries are ordered by recency, while each entry's `order` keeps its position within the DOM stable
+        self._entries: OrderedDict[Key, tuple[int, MatchedRoute, Location]] = OrderedDict()
+        self._count = 0
+
+    def add(self, key: Key, match: MatchedRoute, location: Location) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            self._count += 1
+        self._entries[key] = (self._count if entry is None else entry[0], match, location)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def render(
+        self, current_key: Key, connection: Connection, route_state: Callable[[MatchedRoute], RouteState]
+    ) -> VdomDict:
+        children = []
+        for key, (_, match, location) in sorted(self._entries.items(), key=lambda item: item[1][0]):
+            # Hidden routes keep the location they were matched with, so they don't react to other routes
+            content = ConnectionContext(
+                _route_state_context(match.element, value=route_state(match)),
+                value=Connection(connection.scope, location, connection.carrier),
+            )
+            attributes = (
+                {"key": key, "style": {"display": "contents"}} if key == current_key else {"key": key, "hidden": True}
+            )
+            children.append(html.div(attributes, content))
+        return html(*children)
+
+
+class _NavigationTasks:
+    """The asyncio tasks that belong to the router's current navigation."""
+
+    def __init__(self) -> None:
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+    async def run(self, coroutine: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine as part of the current navigation. If the navigation is superseded before the
+        coroutine finishes, it is cancelled and this raises `asyncio.CancelledError`."""
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return await task
+
+    def cancel(self) -> None:
+        """Cancel every task that belongs to the current navigation."""
+        for task in self._tasks:
+            task.cancel()
+
+
+class _Prefetches:
+    """The prefetches requested by one connection, which are deduplicated and rate limited.
+
+    A path is only prefetched once per `dedupe_seconds`, and at most `limit` paths are prefetched per
+    `interval` seconds. Events beyond that limit are dropped, since prefetching is only an optimization."""
+
+    limit = 8
+    interval = 1.0
+    dedupe_seconds = 30.0
+    maxsize = 64
+
+    def __init__(self) -> None:
+        self._recent: OrderedDict[str, float] = OrderedDict()
+        self._accepted: deque[float] = deque()
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+    def accept(self, path: str) -> bool:
+        now = time.monotonic()
+        while self._accepted and now - self._accepted[0] >= self.interval:
+            self._accepted.popleft()
+        last_prefetched = self._recent.get(path)
+        if len(self._accepted) >= self.limit or (
+            last_prefetched is not None and now - last_prefetched < self.dedupe_seconds
+        ):
+            return False
+
+        self._accepted.append(now)
+        self._recent[path] = now
+        self._recent.move_to_end(path)
+        while len(self._recent) > self.maxsize:
+            self._recent.popitem(last=False)
+        return True
+
+    def start(self, coroutine: Coroutine[Any, Any, Any]) -> None:
+        # Keep a reference to each task, so that it isn't garbage collected before it finishes
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def _replace_location(location: Location, resolved_location: Location, sequence: int) -> VdomDict | None:
+    """Replace the browser's URL with the location a redirect route resolved to, without notifying the server."""
+    if resolved_location == location:
+        return None
+    return ReplaceLocation({
+        "from": location.path + location.query_string,
+        "to": resolved_location.path + resolved_location.query_string,
+        "sequence": sequence,
+    })
+
 
+@component
+def _search_params_sync(store: SearchParamsStore) -> VdomDict | None:
+    """Replace the query string of the browser's URL after it was changed via `use_set_search_params`.
 
-def _add_route_key(match: MatchedRoute, key: str | int) -> Any:
-    """Add a key to the VDOM or component on the current route, if it doesn't already have one."""
+    This subscribes to the store by itself, so that changes don't re-render the whole router."""
+    _use_search_params_store(store)
+    if not store.modified:
+        return None
+    return ReplaceSearch({"path": store.location.path, "search": store.query_string})  # type: ignore[return-value]
+
+
+def _accept_sequenced_event(event: dict[str, Any], last_sequence: Ref[int]) -> bool:
+    """Remove the sequence number from a client event, and check whether the event is newer than the last
+    accepted event. Events without a sequence number are always accepted."""
+    sequence = event.pop("seq", None)
+    if sequence is None:
+        return True
+    if sequence <= last_sequence.current:
+        return False
+    last_sequence.current = sequence
+    return True
+
+
+def _iter_routes(routes: Sequence[Route]) -> Iterator[tuple[tuple[int, ...], Route]]:
+    """Flatten nested routes into their full paths, along with each route's position within the route tree."""
+    for index, parent in enumerate(routes):
+        for position, child in _iter_routes(parent.routes):
+            yield (index, *position), replace(child, path=parent.path + child.path)  # type: ignore[misc]
+        yield (index,), parent
+
+
+def _compile_routes(
+    resolver: Resolver[Route],
+    routes: Sequence[Route],
+    instrumentation: RouterInstrumentation | None = None,
+) -> tuple[RouteTable, tuple[tuple[int, ...], ...]]:
+    """Fetch the compiled table for the routes from the process-wide cache, along with the position
+    of each of the table's routes within the route tree."""
+    flat_routes = tuple(_iter_routes(routes))
+    table = table_cache.get(resolver, (route for _, route in flat_routes), instrumentation)
+    return table, tuple(position for position, _ in flat_routes)
+
+
+def _add_route_key(match: MatchedRoute, key: str | int) -> MatchedRoute:
+    """Add a key to the VDOM or component on the current route, if it doesn't already have one.
+
+    The element is copied rather than modified, since it may be shared with other renders."""
     element = match.element
     if hasattr(element, "render") and not element.key:
-        element = cast("Component", element)
+        element = cast("Component", copy(element))
         element.key = key
     elif isinstance(element, dict) and not element.get("key", None):
-        element = cast("VdomDict", element)
-        element["attributes"]["key"] = key
-    return match
+        element = cast("VdomDict", copy(element))
+        element["attributes"] = {**element.get("attributes", {}), "key": key}
+    else:
+        return match
+    return replace(match, element=element)
 
 
 def _match_route(
-    compiled_routes: Sequence[CompiledRoute],
+    table: RouteTable,
+    positions: Sequence[tuple[int, ...]],
+    routes: Sequence[Route],
     location: Location,
+    instrumentation: RouterInstrumentation | None = None,
 ) -> MatchedRoute | None:
-    for resolver in compiled_routes:
-        match = resolver.resolve(location.path)
-        if match is not None:
-            return _add_route_key(match, resolver.key)
+    result = _resolve_route(table, positions, routes, location, instrumentation)
+    return None if result is None else result[1]
 
-    _logger.debug("No matching route found for %s", location.path)
 
-    return None
+def _resolve_route(
+    table: RouteTable,
+    positions: Sequence[tuple[int, ...]],
+    routes: Sequence[Route],
+    location: Location,
+    instrumentation: RouterInstrumentation | None = None,
+    loader_data: Mapping[str, Any] | None = None,
+) -> tuple[Key, MatchedRoute, tuple[tuple[str, RouteLoader], ...], Location] | None:
+    """Match the location against the route table, and return the compiled key of the winning route, its match,
+    the loaders of the route and its parents (identified by their full path), and the location that was matched.
+
+    Redirect routes are followed (up to `MAX_REDIRECTS` times), so the matched location may differ from the
+    given one. The match's element is taken from this render's routes, and is wrapped by any layout routes. If
+    `loader_data` is provided, each element can read the data of the nearest route with a loader via
+    `use_loader_data`."""
+    for _ in range(MAX_REDIRECTS + 1):
+        if instrumentation is None:
+            result = table.resolve(location.path)
+        else:
+            result = _instrumented_resolve(table, location.path, instrumentation)
+        if result is None:
+            _logger.debug("No matching route found for %s", location.path)
+            return None
+
+        index, match = result
+        # Shared tables are compiled without elements, so use the element from this render's routes
+        chain: list[tuple[Route, str]] = []
+        full_path = ""
+        children = routes
+        for position in positions[index]:
+            current = children[position]
+            full_path += current.path
+            chain.append((current, full_path))
+            children = current.routes
+
+        leaf = chain[-1][0]
+        if leaf.redirect is None:
+            break
+        location = _redirect_location(leaf.redirect, match.params, location)
+    else:
+        msg = f"Too many redirects while resolving {location.path!r} (the limit is {MAX_REDIRECTS})"
+        raise RuntimeError(msg)
+
+    key = table.routes[index].key
+    loaders = tuple((path, current.loader) for current, path in chain if current.loader is not None)
+
+    # Each layout receives the loader data of the nearest route with a loader, up to its own level
+    data: Any = None
+    layouts: list[tuple[Route, str, Any]] = []
+    for current, path in chain:
+        if loader_data is not None and path in loader_data:
+            data = loader_data[path]
+        if current.layout:
+            layouts.append((current, path, data))
+
+    if leaf.layout:
+        match = replace(match, element=None)
+    else:
+        match = _add_route_key(replace(match, element=_resolve_element(leaf.element)), key)
+        if loader_data is not None:
+            match = replace(match, element=_loader_data_context(match.element, value=data))
+        if layouts:
+            # The matched route doesn't have an outlet of its own
+            match = replace(match, element=_outlet_context(match.element, value=None, key=key))
+
+    # Layouts are keyed by their path, so they stay mounted while navigating between their child routes
+    for layout, path, layout_data in reversed(layouts):
+        element = _resolve_element(layout.element)
+        if loader_data is not None:
+            element = _loader_data_context(element, value=layout_data)
+        match = replace(match, element=_outlet_context(element, value=match.element, key=path))
+    return key, match, loaders, location
+
+
+def _redirect_location(to: str, params: dict[str, Any], location: Location) -> Location:
+    """Get the target of a redirect route. The target's query string is kept if it has one, otherwise the
+    query string of the redirected location is kept."""
+    path, separator, query_string = to.format(**params).partition("?")
+    return Location(path, separator + query_string if separator else location.query_string)
+
+
+async def _run_loaders(
+    loaders: Sequence[tuple[str, RouteLoader]],
+    params: dict[str, Any],
+    loader_cache: LoaderCache | None = None,
+) -> dict[str, Any]:
+    """Run the loaders of a matched route and its parents at the same time. Exceptions are stored in place of
+    the loader's data, and are raised by `use_loader_data`."""
+    if loader_cache is None:
+        pending = [loader(params) for _, loader in loaders]
+    else:
+        pending = [loader_cache.load(loader, path, params) for path, loader in loaders]
+    results = await asyncio.gather(*pending, return_exceptions=True)
+    for (path, _), data in zip(loaders, results, strict=True):
+        if isinstance(data, Exception):
+            _logger.error("Failed to load data for route %r", path, exc_info=data)
+    return {path: data for (path, _), data in zip(loaders, results, strict=True)}
+
+
+def _resolve_element(element: Any) -> Any:
+    return element.resolve() if isinstance(element, LazyElement) else element
+
+
+def _instrumented_resolve(
+    table: RouteTable, path: str, instrumentation: RouterInstrumentation
+) -> tuple[int, MatchedRoute] | None:
+    cache_hit = path in table.match_cache
+    start = time.perf_counter()
+    result = table.resolve(path)
+    duration = time.perf_counter() - start
+
+    index = None if result is None else result[0]
+    instrumentation.on_match(
+        MatchEvent(
+            path=path,
+            key=None if index is None else table.routes[index].key,
+            duration=duration,
+            routes_tried=0 if cache_hit else table.attempts(index),
+            cache_hit=cache_hit,
+        )
+    )
+    return result
@@ -0,0 +1,99 @@
+"""Ahead-of-time route tables, which are compiled once and saved to a file that workers can load quickly."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from reactpy_router import __version__
+from reactpy_router.routers import _iter_routes
+from reactpy_router.tables import table_cache
+from reactpy_router.types import Route
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from reactpy_router.resolvers import ReactPyResolver
+    from reactpy_router.tables import RouteTable, RouteTableCache
+
+__all__ = ["FORMAT_VERSION", "dump_route_table", "load_route_table"]
+
+FORMAT_VERSION = 1
+"""The version of the route table file format. Files written with a different version are rejected."""
+
+
+def dump_route_table(resolver: type[ReactPyResolver], routes: Sequence[Route], file: str | os.PathLike[str]) -> None:
+    """
+    Compile a route tree and save the result, so that it can later be loaded with `load_route_table`.
+
+    The file holds each route's regex pattern and flags, converter names, static path and key. The file is
+    written atomically, so workers that are loading it will never see a partially written table.
+
+    Args:
+        resolver: The resolver used to compile each route, which must be `ReactPyResolver` or a subclass of it.
+        routes: The top-level routes of the route tree, as passed to the router.
+        file: The path of the file to write.
+    """
+    compiled_routes = [resolver(route).dump() for _, route in _iter_routes(routes)]
+    path = Path(file)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with temp_path.open("w", encoding="utf-8") as f:
+        # The header is kept on its own line, so that an outdated file can be rejected without parsing the routes
+        json.dump(_header(resolver), f, separators=(",", ":"))
+        f.write("\n")
+        json.dump({"routes": compiled_routes}, f, separators=(",", ":"))
+    temp_path.replace(path)
+
+
+def load_route_table(
+    resolver: type[ReactPyResolver],
+    file: str | os.PathLike[str],
+    cache: RouteTableCache | None = None,
+) -> RouteTable:
+    """
+    Load a route table that was saved by `dump_route_table` into the route table cache.
+
+    Routers that use the same resolver and route tree will use the loaded table, instead of compiling
+    their own. To share the loaded table between forked workers, load it before the workers are forked.
+
+    Args:
+        resolver: The resolver that was used to save the file.
+        file: The path of the file to load.
+        cache: The route table cache to add the table to. Defaults to the cache used by all routers.
+
+    Returns:
+        The loaded route table.
+
+    Raises:
+        ValueError: If the file was saved by a different resolver, converter set, or version of \
+            ReactPy-Router. The route table should be saved again.
+    """
+    data = Path(file).read_bytes()
+    header_end = data.find(b"\n")
+    header = json.loads(data[:header_end]) if header_end != -1 else None
+    expected = _header(resolver)
+    if header != expected:
+        changed = sorted(key for key in expected if not header or header.get(key) != expected[key])
+        msg = f"The route table in {os.fspath(file)!r} is out of date (changed: {', '.join(changed)})"
+        raise ValueError(msg)
+    compiled_routes = json.loads(data[header_end + 1 :])["routes"]
+
+    table = resolver.table_class(tuple(resolver.load(compiled_route) for compiled_route in compiled_routes))
+    flat_routes = [Route(compiled_route["path"], None, ()) for compiled_route in compiled_routes]
+    return (table_cache if cache is None else cache).add(resolver, flat_routes, table)
+
+
+def _header(resolver: type[ReactPyResolver]) -> dict[str, Any]:
+    """Describe everything that a saved route table depends on, other than the routes themselves."""
+    return {
+        "format": FORMAT_VERSION,
+        "version": __version__,
+        "resolver": f"{resolver.__module__}.{resolver.__qualname__}",
+        "param_pattern": resolver.param_pattern,
+        "converters": {
+            name: [info["regex"], f"{info['func'].__module__}.{info['func'].__qualname__}"]
+            for name, info in sorted(resolver.converters.items())
+        },
+    }
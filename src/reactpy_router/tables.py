@@ -0,0 +1,312 @@
+"""Route tables that match a path against an ordered collection of compiled routes."""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import replace
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
+
+from reactpy_router.types import CacheInfo, CompileEvent, MatchedRoute
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Sequence
+    from typing import Self
+
+    from reactpy_router.types import CompiledRoute, Resolver, Route, RouterInstrumentation
+
+__all__ = [
+    "LRUCache",
+    "RouteTable",
+    "RouteTableCache",
+    "compile_table",
+    "fingerprint",
+    "table_cache",
+    "tree_fingerprint",
+]
+
+_Key = TypeVar("_Key", bound="Hashable")
+_Value = TypeVar("_Value")
+_MISSING: Any = object()
+
+
+class LRUCache(Generic[_Key, _Value]):
+    """A thread-safe, size-bounded mapping that evicts the least recently used entry when full."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[_Key, _Value] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: _Key, default: Any = None) -> Any:
+        """Return the value for `key` (marking it as recently used), or `default` if it isn't cached."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: _Key, value: _Value) -> _Value:
+        """Store `value` under `key`, unless a value is already cached. Returns the cached value."""
+        with self._lock:
+            value = self._data.setdefault(key, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return value
+
+    def clear(self) -> None:
+        """Remove every entry from the cache and reset its counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return a snapshot of the cache's statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __contains__(self, key: _Key) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RouteTable:
+    """An ordered table of compiled routes.
+
+    Routes are matched in the order they were declared, and the first route that matches a path wins.
+    Resolvers can provide their own table implementation (for example, one that avoids a linear scan)
+    by setting a `table_class` attribute to a subclass of this class which overrides `match`.
+
+    The results of recent lookups (including misses) are kept in an LRU cache, so repeated paths skip
+    both matching and parameter conversion."""
+
+    match_cache_size: ClassVar[int] = 256
+    """The default number of paths whose results are cached by each table. Set to `0` to disable caching."""
+
+    def __init__(self, routes: Sequence[CompiledRoute], match_cache_size: int | None = None) -> None:
+        self.routes = tuple(routes)
+        self.match_cache: LRUCache[str, tuple[int, dict[str, Any], Any] | None] = LRUCache(
+            self.match_cache_size if match_cache_size is None else match_cache_size
+        )
+        self.static_routes: dict[str, int] = {}
+        self.dynamic_routes: list[tuple[int, CompiledRoute]] = []
+
+        # Routes without parameters are found with a dictionary lookup, rather than a regex match.
+        # Compiled routes expose their literal path via a `static_path` attribute.
+        for index, compiled_route in enumerate(self.routes):
+            static_path: str | None = getattr(compiled_route, "static_path", None)
+            if static_path is None:
+                self.dynamic_routes.append((index, compiled_route))
+            else:
+                self.static_routes.setdefault(static_path, index)
+
+    @classmethod
+    def compile(cls, resolver: Resolver[Route], routes: Iterable[Route], match_cache_size: int | None = None) -> Self:
+        """
+        Compile each route with the given resolver and build a table from the results.
+
+        Args:
+            resolver: The resolver used to compile each route.
+            routes: The flattened routes, in declaration order.
+            match_cache_size: The number of paths whose results are cached. Defaults to `match_cache_size`.
+
+        Returns:
+            The compiled route table.
+        """
+        return cls(tuple(map(resolver, routes)), match_cache_size)
+
+    def resolve(self, path: str) -> tuple[int, MatchedRoute] | None:
+        """
+        Find the first declared route that matches the given path, using the match cache when possible.
+
+        Args:
+            path: The path to resolve.
+
+        Returns:
+            A tuple containing the index of the winning route within `routes` and its match, or None.
+        """
+        if not self.match_cache.maxsize:
+            return self.match(path)
+
+        cached = self.match_cache.get(path, _MISSING)
+        if cached is _MISSING:
+            result = self.match(path)
+            self.match_cache.set(
+                path, None if result is None else (result[0], dict(result[1].params), result[1].element)
+            )
+            return result
+
+        if cached is None:
+            return None
+        # The element is kept from the original match, since it isn't part of the `CompiledRoute` protocol
+        index, params, element = cached
+        return index, MatchedRoute(element, dict(params), path)
+
+    def match(self, path: str) -> tuple[int, MatchedRoute] | None:
+        """
+        Find the first declared route that matches the given path, without using the match cache.
+
+        Args:
+            path: The path to match.
+
+        Returns:
+            A tuple containing the index of the winning route within `routes` and its match, or None.
+        """
+        static_index = self.static_routes.get(path, len(self.routes))
+
+        # A route with parameters that was declared before the static route can still shadow it
+        for index, compiled_route in self.dynamic_routes:
+            if index >= static_index:
+                break
+            match = compiled_route.resolve(path)
+            if match is not None:
+                return index, match
+
+        if static_index < len(self.routes):
+            return static_index, MatchedRoute(getattr(self.routes[static_index], "element", None), {}, path)
+        return None
+
+    def attempts(self, index: int | None) -> int:
+        """
+        Get the number of routes this table tries when a lookup produces the given result.
+
+        Args:
+            index: The index of the winning route, or None if no route matched.
+
+        Returns:
+            The number of routes tried.
+        """
+        if index is None:
+            return len(self.dynamic_routes)
+        return bisect_left(self.dynamic_routes, index, key=itemgetter(0)) + 1
+
+
+def compile_table(
+    resolver: Resolver[Route], routes: Iterable[Route], match_cache_size: int | None = None
+) -> RouteTable:
+    """
+    Compile routes into the route table preferred by the given resolver.
+
+    Args:
+        resolver: The resolver used to compile each route. If it has a `table_class` attribute, \
+            that class is used to build the table. Otherwise, a linear `RouteTable` is used.
+        routes: The flattened routes, in declaration order.
+        match_cache_size: The number of paths whose results are cached. Defaults to the table class's \
+            `match_cache_size`.
+
+    Returns:
+        The compiled route table.
+    """
+    table_class: type[RouteTable] = getattr(resolver, "table_class", RouteTable)
+    return table_class.compile(resolver, routes, match_cache_size)
+
+
+def fingerprint(routes: Iterable[Route]) -> tuple[Route, ...]:
+    """
+    Create a hashable fingerprint of flattened routes that doesn't depend on their elements.
+
+    Args:
+        routes: The flattened routes, in declaration order.
+
+    Returns:
+        The routes with their elements and child routes removed.
+    """
+    return tuple(replace(route, element=None, routes=()) for route in routes)  # type: ignore[misc]
+
+
+def tree_fingerprint(routes: Iterable[Route]) -> int:
+    """
+    Create a fingerprint of a route tree that doesn't depend on its elements.
+
+    Each route computes the fingerprint of its own subtree when it is created, so this only needs to
+    combine the fingerprints of the top-level routes.
+
+    Args:
+        routes: The top-level routes of the tree.
+
+    Returns:
+        A hash of the route tree's structure.
+    """
+    return hash(tuple(route._fingerprint for route in routes))
+
+
+class RouteTableCache:
+    """A thread-safe, size-bounded cache of compiled route tables that is shared by every connection.
+
+    Tables are keyed by their resolver and the fingerprint of their routes. Since cached tables are compiled
+    without elements, the caller is responsible for pairing a match with the element of its own route."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._tables: LRUCache[tuple[Resolver[Route], tuple[Route, ...]], RouteTable] = LRUCache(maxsize)
+
+    def get(
+        self,
+        resolver: Resolver[Route],
+        routes: Iterable[Route],
+        instrumentation: RouterInstrumentation | None = None,
+    ) -> RouteTable:
+        """
+        Get the compiled table for the given routes, compiling it if it isn't already cached.
+
+        Args:
+            resolver: The resolver used to compile each route.
+            routes: The flattened routes, in declaration order.
+            instrumentation: If provided, this is notified when a table is compiled.
+
+        Returns:
+            The shared route table.
+        """
+        key = (resolver, fingerprint(routes))
+        table: RouteTable | None = self._tables.get(key)
+        if table is not None:
+            return table
+
+        # Compile outside of the cache's lock, so that a slow compilation doesn't block other connections
+        if instrumentation is None:
+            return self._tables.set(key, compile_table(resolver, key[1]))
+
+        start = time.perf_counter()
+        table = compile_table(resolver, key[1])
+        duration = time.perf_counter() - start
+        instrumentation.on_compile(CompileEvent(getattr(resolver, "__name__", repr(resolver)), len(key[1]), duration))
+        return self._tables.set(key, table)
+
+    def add(self, resolver: Resolver[Route], routes: Iterable[Route], table: RouteTable) -> RouteTable:
+        """
+        Add a table that was compiled elsewhere (such as one loaded from a file) to the cache.
+
+        Args:
+            resolver: The resolver that was used to compile the table.
+            routes: The flattened routes, in declaration order.
+            table: The compiled route table.
+
+        Returns:
+            The shared route table, which is the existing table if these routes were already cached.
+        """
+        return self._tables.set((resolver, fingerprint(routes)), table)
+
+    def clear(self) -> None:
+        """Remove every table from the cache."""
+        self._tables.clear()
+
+    def info(self) -> CacheInfo:
+        """Return a snapshot of the cache's statistics."""
+        return self._tables.info()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+
+table_cache = RouteTableCache()
+"""The process-wide route table cache used by all routers."""
@@ -2,26 +2,35 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Self, TypeAlias, TypedDict, TypeVar
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, Self, TypeAlias, TypedDict, TypeVar
 
 from reactpy.core.vdom import is_vdom
 from typing_extensions import Protocol
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Hashable, Sequence
 
     from reactpy.types import Component, Key, Location
 
+    from reactpy_router.hooks import SearchParamsStore
+    from reactpy_router.tables import LRUCache
+
 ConversionFunc: TypeAlias = Callable[[str], Any]
 """A function that converts a string to a specific type."""
 
 ConverterMapping: TypeAlias = dict[str, ConversionFunc]
 """A mapping of conversion types to their respective functions."""
 
+RouteLoader: TypeAlias = Callable[[dict[str, Any]], Awaitable[Any]]
+"""An async function that loads a route's data, given the parameters of the matched path."""
 
-@dataclass(frozen=True)
+SearchParamsSchema: TypeAlias = Mapping[str, Any] | type
+"""A mapping of query string parameter names to types, or a class (such as a `TypedDict`) with type annotations."""
+
+
+@dataclass(frozen=True, slots=True)
 class Route:
     """
     A class representing a route that can be matched against a path.
@@ -30,6 +39,11 @@ class Route:
         path: The path to match against.
         element: The element to render if the path matches.
         routes: Child routes.
+        layout: Whether this route's element is a layout, which stays mounted while any of its \
+            child routes are matched and renders the matched child via `outlet`.
+        loader: An async function that loads this route's data, which can be read via `use_loader_data`.
+        redirect: The path this route redirects to, which is resolved by the router instead of \
+            rendering the route's element.
 
     Methods:
         __hash__() -> int: Returns a hash value for the route based on its path, element, and child routes.
@@ -38,15 +52,34 @@ class Route:
     path: str
     element: Any = field(hash=False)
     routes: Sequence[Self]
-
-    def __hash__(self) -> int:
+    # Layouts don't affect which route matches a path, so they aren't part of the route's fingerprint
+    layout: bool = field(default=False, compare=False)
+    loader: RouteLoader | None = field(default=None, compare=False)
+    redirect: str | None = field(default=None, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False, hash=False)
+    _fingerprint: int = field(init=False, repr=False, compare=False, hash=False)
+
+    def __post_init__(self) -> None:
+        # Routes are immutable, so their hashes are computed once rather than re-walking
+        # the whole route tree every time a router renders.
         el = self.element
         key = (
             el["attributes"]["key"]
             if is_vdom(el) and "attributes" in el and "key" in el["attributes"]
             else getattr(el, "key", id(el))
         )
-        return hash((self.path, key, self.routes))
+        object.__setattr__(self, "_hash", hash((self.path, key, self.routes)))
+
+        # The fingerprint is a hash of the route tree's structure, which doesn't depend on any elements
+        structure = tuple(
+            getattr(self, f.name) for f in fields(self) if f.compare and f.name not in {"element", "routes"}
+        )
+        object.__setattr__(
+            self, "_fingerprint", hash((type(self), structure, tuple(route._fingerprint for route in self.routes)))
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
 
 
 RouteType_contra = TypeVar("RouteType_contra", bound=Route, contravariant=True)
@@ -125,6 +158,22 @@ class MatchedRoute:
     path: str
 
 
+@dataclass(frozen=True)
+class Navigation:
+    """
+    The navigation state of a router, as returned by `use_navigation`.
+
+    Attributes:
+        state: "loading" while the data of a newly matched route is being loaded, otherwise "idle".
+        location: The location of the route that is currently shown.
+        pending_location: The location that is being loaded, or None if the router is idle.
+    """
+
+    state: Literal["idle", "loading"]
+    location: Location
+    pending_location: Location | None = None
+
+
 class ConversionInfo(TypedDict):
     """
     A TypedDict that holds information about a conversion type.
@@ -138,6 +187,82 @@ class ConversionInfo(TypedDict):
     func: ConversionFunc
 
 
+class CacheInfo(NamedTuple):
+    """
+    A snapshot of a cache's statistics.
+
+    Attributes:
+        hits: The number of lookups that were found in the cache.
+        misses: The number of lookups that were not found in the cache.
+        maxsize: The maximum number of entries the cache can hold.
+        currsize: The number of entries currently in the cache.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass(frozen=True)
+class MatchEvent:
+    """
+    Information about a single route lookup, as reported to `RouterInstrumentation`.
+
+    Attributes:
+        path: The path that was resolved.
+        key: The key of the matched route, or None if no route matched.
+        duration: The time spent resolving the path, in seconds.
+        routes_tried: The number of routes the table tried before finding the result.
+        cache_hit: Whether the result was served from the table's match cache.
+    """
+
+    path: str
+    key: Key | None
+    duration: float
+    routes_tried: int
+    cache_hit: bool
+
+
+@dataclass(frozen=True)
+class CompileEvent:
+    """
+    Information about the compilation of a route table, as reported to `RouterInstrumentation`.
+
+    Attributes:
+        resolver: The name of the resolver used to compile the table.
+        routes: The number of routes within the table.
+        duration: The time spent compiling the table, in seconds.
+    """
+
+    resolver: str
+    routes: int
+    duration: float
+
+
+class RouterInstrumentation(Protocol):
+    """An object that is notified about the routing work performed by a router."""
+
+    def on_match(self, event: MatchEvent) -> None:
+        """
+        Called after a router resolves the current path.
+
+        Args:
+            event: Information about the lookup.
+        """
+        ...
+
+    def on_compile(self, event: CompileEvent) -> None:
+        """
+        Called after a route table is compiled. Tables that are served from the process-wide table cache \
+        are not compiled again, and therefore are not reported.
+
+        Args:
+            event: Information about the compilation.
+        """
+        ...
+
+
 @dataclass
 class RouteState:
     """
@@ -146,7 +271,17 @@ class RouteState:
     Attributes:
         set_location: A callable to set the location.
         params: A dictionary containing route parameters.
+        on_client_location: A callable that accepts a location reported by the client, which is \
+            ignored if the router has already accepted a newer one. If this is None, \
+            `set_location` is used instead.
+        search_params_cache: A cache of parsed query strings that is shared by every \
+            `use_search_params` hook within the router. If this is None, query strings are not cached.
+        search_params: The router's current query string, which can be changed by \
+            `use_set_search_params`. If this is None, the query string can't be changed.
     """
 
     set_location: Callable[[Location], None]
     params: dict[str, Any]
+    on_client_location: Callable[[dict[str, Any]], None] | None = None
+    search_params_cache: LRUCache[Hashable, Mapping[str, Any]] | None = None
+    search_params: SearchParamsStore | None = None
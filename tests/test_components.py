@@ -0,0 +1,83 @@
+import pytest
+from reactpy import html
+from reactpy.types import Location
+
+from reactpy_router import lazy, link, redirect, route
+from reactpy_router.components import LazyElement
+from reactpy_router.resolvers import ReactPyResolver
+from reactpy_router.routers import _compile_routes, _match_route
+
+
+def test_link_is_plain_vdom():
+    assert link({"to": "/a", "className": "nav"}, "A", key="a") == html.a(
+        {"className": "nav", "key": "a", "href": "/a", "data-reactpy-router-link": ""}, "A"
+    )
+    assert link({"href": "/b"}, html.b("B")) == html.a({"href": "/b", "data-reactpy-router-link": ""}, html.b("B"))
+
+
+def test_link_requires_to():
+    with pytest.raises(ValueError, match="The `to` attribute is required"):
+        link({"id": "a"}, "A")
+
+
+def test_link_prefetch():
+    assert link({"to": "/a", "prefetch": "hover"}, "A") == html.a(
+        {"href": "/a", "data-reactpy-router-link": "", "data-reactpy-router-prefetch": "hover"}, "A"
+    )
+    with pytest.raises(ValueError, match="must be 'hover' or 'visible'"):
+        link({"to": "/a", "prefetch": "click"}, "A")
+
+
+def test_redirect_validates_target():
+    assert redirect("/users/{id:int}/{tab}", "/members/{id}?tab={tab}").redirect == "/members/{id}?tab={tab}"
+    with pytest.raises(ValueError, match="must be absolute paths"):
+        redirect("/a", "b")
+    with pytest.raises(ValueError, match=r"aren't part of .*: name$"):
+        redirect("/users/{id:int}", "/members/{name}")
+    with pytest.raises(ValueError, match="not a valid format string"):
+        redirect("/users/{id:int}", "/members/{id")
+    with pytest.raises(ValueError, match="numeric parameters: 404"):
+        redirect("/{404}", "/{404}")
+
+
+def test_redirect_uses_resolver_param_syntax():
+    class AngleResolver(ReactPyResolver):
+        param_pattern = r"<(?P<name>\w+)(?P<type>:\w+)?>"
+
+    assert redirect("/u/<id:int>", "/users/{id}", resolver=AngleResolver).redirect == "/users/{id}"
+    with pytest.raises(ValueError, match=r"aren't part of .*: id$"):
+        redirect("/u/<id:int>", "/users/{id}")
+
+
+LAZY_ELEMENT = html.p({"id": "lazy"}, "lazy")
+
+
+def test_lazy_elements_are_created_on_first_match():
+    calls = []
+
+    def make_element():
+        calls.append(None)
+        return html.p("factory")
+
+    routes = [route("/factory", make_element), route("/import", lazy("tests.test_components:LAZY_ELEMENT"))]
+    table, positions = _compile_routes(ReactPyResolver, routes)
+    assert isinstance(routes[0].element, LazyElement)
+    assert not routes[1].element.resolved
+    assert calls == []
+
+    for _ in range(2):
+        match = _match_route(table, positions, routes, Location("/factory", ""))
+        assert match.element == html.p({"key": "^/factory$"}, "factory")
+    assert calls == [None]
+
+    match = _match_route(table, positions, routes, Location("/import", ""))
+    assert match.element == html.p({"id": "lazy", "key": "^/import$"}, "lazy")
+    assert routes[1].element.resolved
+
+
+def test_lazy_import_string():
+    assert lazy("tests.test_components:test_lazy_import_string.__name__").resolve() == "test_lazy_import_string"
+    assert lazy("reactpy:html.p").resolve() == html.p()
+    assert repr(lazy("a:b")) == "LazyElement('a:b')"
+    with pytest.raises(ValueError, match="format 'module:attribute'"):
+        lazy("tests.test_components")
@@ -0,0 +1,192 @@
+from typing import Optional, TypedDict
+from unittest import mock
+from urllib.parse import parse_qs
+
+import pytest
+from reactpy import component, html, use_effect
+from reactpy.core.hooks import ConnectionContext
+from reactpy.core.layout import Layout
+from reactpy.types import Connection, Location
+
+from reactpy_router import browser_router, outlet, route, use_outlet, use_search_params, use_set_search_params
+from reactpy_router.hooks import _convert_search_params, _schema_fields, _use_route_state
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_search_params_are_cached_per_router():
+    results = []
+    set_location = None
+
+    @component
+    def check_query():
+        nonlocal set_location
+        set_location = _use_route_state().set_location
+        results.append(use_search_params())
+        results.append(use_search_params(schema={"page": int}))
+        return html.p()
+
+    @component
+    def sample():
+        return ConnectionContext(
+            browser_router(route("/", html.div(check_query(), check_query()))),
+            value=Connection(scope={}, location=Location("/", "?page=2&tags=a"), carrier=None),
+        )
+
+    with mock.patch("reactpy_router.hooks.parse_qs", wraps=parse_qs) as parse_qs_mock:
+        async with Layout(sample()) as layout:
+            await layout.render()
+            # Each combination of options is only parsed once, even though it's used by two components
+            assert parse_qs_mock.call_count == 2
+            assert results[0] == {"page": ["2"], "tags": ["a"]}
+            assert results[1] == {"page": 2}
+            assert results[2] == results[0]
+            assert results[3] == results[1]
+            with pytest.raises(TypeError):
+                results[0]["page"] = ["3"]
+
+            # Each component gets its own copies of the cached lists
+            results[0]["tags"].append("b")
+            assert results[2] == {"page": ["2"], "tags": ["a"]}
+
+            # A new query string is parsed again
+            set_location(Location("/", "?page=3"))
+            await layout.render()
+            assert parse_qs_mock.call_count == 4
+            assert results[-1] == {"page": 3}
+
+
+def test_search_params_schema():
+    class Schema(TypedDict):
+        page: int
+        tags: list[str]
+        ids: list[int]
+        draft: bool
+        missing: str
+
+    params = {"page": ["2", "3"], "tags": ["a", "b"], "ids": ["1", "x"], "draft": ["true"]}
+    assert _convert_search_params(params, _schema_fields(Schema)) == {"page": 2, "tags": ["a", "b"], "draft": True}
+    assert _convert_search_params({"page": ["x"], "draft": ["0"]}, _schema_fields({"page": int, "draft": bool})) == {
+        "draft": False
+    }
+    assert _convert_search_params({"tags": ["red", "blue"]}, _schema_fields({"tags": list})) == {
+        "tags": ["red", "blue"]
+    }
+    assert _convert_search_params(
+        {"page": ["12"], "size": ["34"], "ids": ["56", "78"], "q": ["abc"]},
+        _schema_fields({"page": Optional[int], "size": int | None, "ids": list[int] | None, "q": int | str}),  # noqa: UP045
+    ) == {"page": 12, "size": 34, "ids": [56, 78], "q": "abc"}
+    assert _schema_fields(None) is None
+
+
+async def test_set_search_params_only_renders_readers():
+    renders = {"reader": 0, "other": 0}
+    results = []
+    set_search_params = None
+
+    @component
+    def reader():
+        renders["reader"] += 1
+        results.append(use_search_params())
+        return html.p()
+
+    @component
+    def other():
+        nonlocal set_search_params
+        renders["other"] += 1
+        set_search_params = use_set_search_params()
+        return html.p()
+
+    @component
+    def sample():
+        return ConnectionContext(
+            browser_router(route("/", html.div(reader(), other()))),
+            value=Connection(scope={}, location=Location("/", "?a=1&b=2&b=3"), carrier=None),
+        )
+
+    async with Layout(sample()) as layout:
+        await layout.render()
+        assert renders == {"reader": 1, "other": 1}
+
+        # Changes from the same event are merged, and only cause one render of each subscriber
+        set_search_params({"a": None, "c": "x y"})
+        set_search_params({"b": [4], "d": 5})
+        await layout.render()
+        await layout.render()
+        assert renders == {"reader": 2, "other": 1}
+        assert results[-1] == {"b": ["4"], "c": ["x y"], "d": ["5"]}
+
+        set_search_params({"b": None, "c": None, "d": None})
+        await layout.render()
+        await layout.render()
+        assert results[-1] == {}
+
+
+async def test_layouts_stay_mounted():
+    mounts = []
+    set_location = None
+
+    @component
+    def app_layout():
+        nonlocal set_location
+        set_location = _use_route_state().set_location
+
+        @use_effect(dependencies=[])
+        def mount():
+            mounts.append(None)
+
+        return html.main(html.h1("App"), outlet())
+
+    @component
+    def child(name):
+        return html.p({"id": name}, use_outlet() or f"{name} has no outlet")
+
+    @component
+    def sample():
+        return ConnectionContext(
+            browser_router(
+                route("/app", app_layout(), route("/a", child("a")), route("/b", child("b")), layout=True),
+            ),
+            value=Connection(scope={}, location=Location("/app/a", ""), carrier=None),
+        )
+
+    async with Layout(sample()) as layout:
+        update = await layout.render()
+        assert "'id': 'a'" in str(update)
+        assert "a has no outlet" in str(update)
+
+        set_location(Location("/app/b", ""))
+        update = await layout.render()
+        assert "'id': 'b'" in str(update)
+
+        # The layout itself can be matched, in which case its outlet is empty
+        set_location(Location("/app", ""))
+        update = await layout.render()
+        assert "'id'" not in str(update)
+        assert mounts == [None]
+
+
+async def test_set_search_params_syncs_reverted_query_string():
+    set_search_params = None
+
+    @component
+    def page():
+        nonlocal set_search_params
+        set_search_params = use_set_search_params()
+        return html.p()
+
+    @component
+    def sample():
+        return ConnectionContext(
+            browser_router(route("/", page())),
+            value=Connection(scope={}, location=Location("/", "?a=1"), carrier=None),
+        )
+
+    async with Layout(sample()) as layout:
+        await layout.render()
+        set_search_params({"a": 2})
+        assert "'search': '?a=2'" in str(await layout.render())
+
+        # Changing the query string back to the router's location must still update the browser's URL
+        set_search_params({"a": 1})
+        assert "'search': '?a=1'" in str(await layout.render())
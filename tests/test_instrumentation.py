@@ -0,0 +1,72 @@
+from reactpy.types import Location
+
+from reactpy_router import route
+from reactpy_router.instrumentation import RouteStats
+from reactpy_router.resolvers import AlternationResolver, ReactPyResolver, TrieResolver
+from reactpy_router.routers import _match_route
+from reactpy_router.tables import RouteTableCache, compile_table
+from reactpy_router.types import CompileEvent, MatchEvent
+
+
+def test_route_stats():
+    stats = RouteStats()
+    stats.on_compile(CompileEvent("ReactPyResolver", 3, 0.5))
+    stats.on_match(MatchEvent("/a", "^/a$", 0.25, 2, cache_hit=False))
+    stats.on_match(MatchEvent("/a", "^/a$", 0.25, 0, cache_hit=True))
+    stats.on_match(MatchEvent("/b", None, 0.5, 3, cache_hit=False))
+
+    assert stats.get_stats() == {
+        "matches": {"hit": 2, "miss": 1, "total": 3},
+        "match_seconds": {"total": 1.0, "average": 1 / 3, "max": 0.5},
+        "routes_tried": {"total": 5, "average": 5 / 3},
+        "match_cache": {"hit": 1, "miss": 2},
+        "route_matches": {"^/a$": 2},
+        "compiles": {"ReactPyResolver": {"count": 1, "seconds": 0.5}},
+    }
+
+    stats.reset()
+    assert stats.get_stats()["matches"] == {"hit": 0, "miss": 0, "total": 0}
+    assert stats.get_stats()["routes_tried"] == {"total": 0, "average": 0}
+
+
+def test_route_stats_prometheus():
+    stats = RouteStats()
+    stats.on_compile(CompileEvent("TrieResolver", 3, 0.5))
+    stats.on_match(MatchEvent("/a", '^/"a"$', 0.25, 2, cache_hit=False))
+
+    metrics = stats.to_prometheus()
+    assert "# TYPE reactpy_router_matches_total counter" in metrics
+    assert 'reactpy_router_matches_total{result="hit"} 1' in metrics
+    assert "reactpy_router_match_duration_seconds_sum 0.25" in metrics
+    assert "reactpy_router_match_duration_seconds_count 1" in metrics
+    assert "reactpy_router_routes_tried_total 2" in metrics
+    assert 'reactpy_router_route_matches_total{key="^/\\"a\\"$"} 1' in metrics
+    assert 'reactpy_router_compile_duration_seconds_sum{resolver="TrieResolver"} 0.5' in metrics
+    assert metrics.endswith("\n")
+    assert stats.to_prometheus(prefix="app").startswith("# HELP app_matches_total")
+
+
+def test_match_route_instrumentation():
+    stats = RouteStats()
+    routes = [route("/a/{x:int}", "a"), route("/b/{x:int}", "b"), route("/c", "c")]
+    table = RouteTableCache().get(ReactPyResolver, routes, stats)
+    positions = ((0,), (1,), (2,))
+
+    assert _match_route(table, positions, routes, Location("/b/1", ""), stats).element == "b"
+    assert _match_route(table, positions, routes, Location("/b/1", ""), stats).element == "b"
+    assert _match_route(table, positions, routes, Location("/c", ""), stats).element == "c"
+    assert _match_route(table, positions, routes, Location("/d", ""), stats) is None
+
+    snapshot = stats.get_stats()
+    assert snapshot["matches"] == {"hit": 3, "miss": 1, "total": 4}
+    assert snapshot["match_cache"] == {"hit": 1, "miss": 3}
+    assert snapshot["routes_tried"]["total"] == 2 + 0 + 3 + 2
+    assert snapshot["route_matches"] == {r"^/b/(?P<x>\d+)$": 2, "^/c$": 1}
+    assert snapshot["compiles"]["ReactPyResolver"]["count"] == 1
+
+
+def test_table_attempts():
+    routes = [route("/a", "a"), route("/b/{x}", "b"), route("/c-{x}", "c"), route("/d", "d")]
+    assert [compile_table(ReactPyResolver, routes).attempts(i) for i in (0, 1, 3, None)] == [1, 1, 3, 2]
+    assert [compile_table(TrieResolver, routes).attempts(i) for i in (0, 2, 3, None)] == [1, 1, 2, 2]
+    assert compile_table(AlternationResolver, routes).attempts(None) == 1
@@ -0,0 +1,101 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from reactpy_router import loaders
+from reactpy_router.loaders import LoaderCache
+from reactpy_router.types import CacheInfo
+
+pytestmark = pytest.mark.anyio
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(loaders, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+def counting_loader(calls):
+    async def loader(params):
+        calls.append(params)
+        await asyncio.sleep(0)
+        return f"user {params['id']} ({len(calls)})"
+
+    return loader
+
+
+async def test_loader_cache_ttl(clock):
+    cache = LoaderCache(ttl=10, stale_ttl=0)
+    calls = []
+    loader = counting_loader(calls)
+
+    assert await cache.load(loader, "/users/{id:int}", {"id": 1}) == "user 1 (1)"
+    assert await cache.load(loader, "/users/{id:int}", {"id": 1}) == "user 1 (1)"
+    assert await cache.load(loader, "/users/{id:int}", {"id": 2}) == "user 2 (2)"
+    assert await cache.load(loader, "/other", {"id": 1}) == "user 1 (3)"
+
+    clock.now = 10
+    assert await cache.load(loader, "/users/{id:int}", {"id": 1}) == "user 1 (4)"
+    assert cache.info() == CacheInfo(hits=1, misses=4, maxsize=256, currsize=3)
+
+
+async def test_loader_cache_stale_while_revalidate(clock):
+    cache = LoaderCache(ttl=10, stale_ttl=10)
+    calls = []
+    loader = counting_loader(calls)
+    await cache.load(loader, "/a", {"id": 1})
+
+    # Stale results are served immediately, and only one refresh is started for them
+    clock.now = 15
+    assert await cache.load(loader, "/a", {"id": 1}) == "user 1 (1)"
+    assert await cache.load(loader, "/a", {"id": 1}) == "user 1 (1)"
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert len(calls) == 2
+    assert await cache.load(loader, "/a", {"id": 1}) == "user 1 (2)"
+
+    # Expired results are fetched again before they are returned
+    clock.now = 40
+    assert await cache.load(loader, "/a", {"id": 1}) == "user 1 (3)"
+
+
+async def test_loader_cache_single_flight(clock):
+    cache = LoaderCache()
+    calls = []
+    loader = counting_loader(calls)
+
+    results = await asyncio.gather(*(cache.load(loader, "/a", {"id": 1}) for _ in range(5)))
+    assert results == ["user 1 (1)"] * 5
+    assert len(calls) == 1
+
+
+async def test_loader_cache_errors_and_size(clock):
+    cache = LoaderCache(maxsize=2)
+    failures = []
+
+    async def failing_loader(params):
+        failures.append(params)
+        raise LookupError(params["id"])
+
+    for _ in range(2):
+        with pytest.raises(LookupError):
+            await cache.load(failing_loader, "/a", {"id": 1})
+    assert len(failures) == 2
+    assert len(cache) == 0
+
+    loader = counting_loader([])
+    for user_id in range(3):
+        await cache.load(loader, "/a", {"id": user_id})
+    assert len(cache) == 2
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
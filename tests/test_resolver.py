@@ -4,9 +4,54 @@ import uuid
 import pytest
 
 from reactpy_router import route
-from reactpy_router.resolvers import ReactPyResolver
+from reactpy_router.resolvers import (
+    AlternationResolver,
+    AlternationRouteTable,
+    ReactPyResolver,
+    TrieResolver,
+    TrieRouteTable,
+)
+from reactpy_router.tables import RouteTable, compile_table
 from reactpy_router.types import MatchedRoute
 
+PARITY_ROUTES = [
+    route("/", "root"),
+    route("/users", "users"),
+    route("/users/{id:int}", "user by id"),
+    route("/users/{name:slug}", "user by name"),
+    route("/users/new", "shadowed by slug"),
+    route("/users/{id:int}/posts/{post:uuid}", "user post"),
+    route("/files/{rest:path}", "files"),
+    route("/files/readme", "shadowed by path"),
+    route("/file-{id:int}.txt", "mixed segment"),
+    route("/{section}/about", "section about"),
+    route("/prices/{amount:float}", "price"),
+    route("/{1st:int}/{2nd}", "numeric names"),
+    route("/static/{p:path}/edit", "non-trailing path"),
+    route("{404:any}", "not found"),
+]
+PARITY_PATHS = [
+    "",
+    "/",
+    "/users",
+    "/users/",
+    "/users/42",
+    "/users/new",
+    "/users/john-doe",
+    "/users/42/posts/1A2B3C4D-0000-0000-0000-000000000000",
+    "/users/42/posts/not-a-uuid",
+    "/files/a/b/c.txt",
+    "/files/",
+    "/files/readme",
+    "/file-7.txt",
+    "/blog/about",
+    "/prices/3.50",
+    "/1/two",
+    "/static/js/app/edit",
+    "/static//edit",
+    "/missing/page",
+]
+
 
 def test_resolve_any():
     resolver = ReactPyResolver(route("{404:any}", "Hello World"))
@@ -70,3 +115,136 @@ def test_parse_path_re_escape():
     resolver = ReactPyResolver(route("/", None))
     assert resolver.parse_path("/a/{b:int}/c.d") == re.compile(r"^/a/(?P<b>\d+)/c\.d$")
     assert resolver.converter_mapping == {"b": int}
+
+
+def test_compile_table_uses_resolver_table_class():
+    assert type(compile_table(ReactPyResolver, [route("/", None)])) is RouteTable
+    assert type(compile_table(TrieResolver, [route("/", None)])) is TrieRouteTable
+    assert type(compile_table(AlternationResolver, [route("/", None)])) is AlternationRouteTable
+    assert type(compile_table(lambda r: ReactPyResolver(r), [route("/", None)])) is RouteTable  # noqa: PLW0108
+
+
+class LazyResolver(ReactPyResolver):
+    lazy_compile = True
+
+
+@pytest.mark.parametrize("resolver", [TrieResolver, AlternationResolver, LazyResolver])
+@pytest.mark.parametrize("path", PARITY_PATHS)
+def test_table_resolvers_match_linear_scan(resolver, path):
+    linear = compile_table(ReactPyResolver, PARITY_ROUTES)
+    table = compile_table(resolver, PARITY_ROUTES)
+    assert table.resolve(path) == linear.resolve(path)
+
+
+def test_trie_resolver_first_declared_wins():
+    table = compile_table(
+        TrieResolver,
+        [
+            route("/a/{x:str}", "str"),
+            route("/a/{x:int}", "int"),
+            route("/a/1", "static"),
+        ],
+    )
+    assert table.resolve("/a/1") == (0, MatchedRoute("str", {"x": "1"}, "/a/1"))
+
+
+def test_trie_resolver_miss():
+    table = compile_table(TrieResolver, [route("/a/{x:int}", "int"), route("/b", "b")])
+    assert table.resolve("/a/b") is None
+    assert table.resolve("/b/c") is None
+    assert compile_table(TrieResolver, []).resolve("/") is None
+
+
+def test_trie_resolver_parse_segments():
+    resolver = TrieResolver(route("/", None))
+    assert resolver.parse_segments("/a/b") == ("", "a", "b")
+    assert resolver.parse_segments("/a-{b}") is None
+    assert resolver.parse_segments("/{a:path}/b") is None
+
+    segments = resolver.parse_segments("/{a:int}/{b:path}")
+    assert segments is not None
+    assert [(s.name, s.type, s.multi_segment) for s in segments[1:]] == [("a", "int", False), ("b", "path", True)]
+
+
+def test_alternation_resolver_renames_groups():
+    table = compile_table(
+        AlternationResolver,
+        [
+            route("/a/{x:int}", "a"),
+            route("/b/{x:float}/{404}", "b"),
+        ],
+    )
+    assert table.pattern.pattern == (
+        r"(?P<r0>^/a/(?P<r0_x>\d+)$)|(?P<r1>^/b/(?P<r1_x>\d+(\.\d+)?)/(?P<r1__numeric_404>[^/]+)$)"
+    )
+    assert table.resolve("/b/1.5/c") == (1, MatchedRoute("b", {"x": 1.5, "404": "c"}, "/b/1.5/c"))
+    assert table.resolve("/c") is None
+    assert compile_table(AlternationResolver, []).resolve("/") is None
+
+
+def test_lazy_resolver_compiles_on_prefix_match():
+    compiled_route = LazyResolver(route("/users/{id:int}/posts", "posts"))
+    assert compiled_route.prefix == "/users/"
+    assert compiled_route.key == "^/users/(?P<id>\\d+)/posts$"
+    assert "pattern" not in vars(compiled_route)
+
+    assert compiled_route.resolve("/files/1/posts") is None
+    assert "pattern" not in vars(compiled_route)
+
+    assert compiled_route.resolve("/users/1/posts") == MatchedRoute("posts", {"id": 1}, "/users/1/posts")
+    assert vars(compiled_route)["pattern"].pattern == compiled_route.key
+
+    assert "pattern" in vars(ReactPyResolver(route("/users/{id:int}", None)))
+
+
+@pytest.mark.parametrize("lazy_compile", [False, True])
+def test_parse_path_override(lazy_compile):
+    class CaseInsensitiveResolver(ReactPyResolver):
+        def parse_path(self, path):
+            return re.compile(self.build_pattern(path), re.IGNORECASE)
+
+    CaseInsensitiveResolver.lazy_compile = lazy_compile
+    compiled_route = CaseInsensitiveResolver(route("/users/{id:int}", "user"))
+    assert compiled_route.resolve("/USERS/1") == MatchedRoute("user", {"id": 1}, "/USERS/1")
+
+    table = compile_table(CaseInsensitiveResolver, [route("/about", "about")])
+    assert table.resolve("/About") == (0, MatchedRoute("about", {}, "/About"))
+
+
+def case_insensitive(resolver):
+    class CaseInsensitiveResolver(resolver):
+        def parse_path(self, path):
+            return re.compile(self.build_pattern(path), re.IGNORECASE)
+
+    return CaseInsensitiveResolver
+
+
+@pytest.mark.parametrize("resolver", [TrieResolver, AlternationResolver])
+def test_table_resolvers_use_parse_path_override(resolver):
+    routes = [route("/users/{id:int}", "user"), route("/about", "about")]
+    table = compile_table(case_insensitive(resolver), routes)
+    assert table.resolve("/USERS/1") == (0, MatchedRoute("user", {"id": 1}, "/USERS/1"))
+    assert table.resolve("/About") == (1, MatchedRoute("about", {}, "/About"))
+    assert table.resolve("/missing") is None
+
+
+def test_alternation_table_scopes_flags_to_their_route():
+    class MixedResolver(AlternationResolver):
+        def parse_path(self, path):
+            flags = re.IGNORECASE if path == "/about" else 0
+            return re.compile(self.build_pattern(path), flags)
+
+    table = compile_table(MixedResolver, [route("/users/{id:int}", "user"), route("/about", "about")])
+    assert table.resolve("/About") == (1, MatchedRoute("about", {}, "/About"))
+    assert table.resolve("/USERS/1") is None
+
+
+def test_alternation_table_matches_unscoped_flags_per_route():
+    class AsciiResolver(AlternationResolver):
+        def parse_path(self, path):
+            return re.compile(self.build_pattern(path), re.ASCII)
+
+    table = compile_table(AsciiResolver, [route("/{name:str}", "name"), route("/about", "about")])
+    assert table.pattern is None
+    assert table.resolve("/about") == (0, MatchedRoute("name", {"name": "about"}, "/about"))
+    assert table.attempts(0) == 1
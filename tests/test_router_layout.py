@@ -0,0 +1,320 @@
+import asyncio
+
+import pytest
+from reactpy import Ref, component, html, use_effect, use_location
+from reactpy.core.hooks import ConnectionContext
+from reactpy.core.layout import Layout
+from reactpy.types import Connection, Location
+
+from reactpy_router import (
+    browser_router,
+    create_router,
+    link,
+    outlet,
+    redirect,
+    route,
+    use_loader_data,
+    use_navigation,
+)
+from reactpy_router.hooks import _use_route_state
+from reactpy_router.loaders import LoaderCache
+from reactpy_router.resolvers import ReactPyResolver
+from reactpy_router.routers import _accept_sequenced_event, _compile_routes, _match_route, _resolve_route
+from reactpy_router.types import MatchedRoute
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_keep_alive_router():
+    mounts = []
+    set_location = None
+
+    @component
+    def page(name):
+        nonlocal set_location
+        set_location = _use_route_state().set_location
+
+        @use_effect(dependencies=[])
+        def mount():
+            mounts.append(name)
+
+        return html.p({"id": name}, name)
+
+    keep_alive_router = create_router(ReactPyResolver, keep_alive=2)
+
+    @component
+    def sample():
+        return ConnectionContext(
+            keep_alive_router(route("/a", page("a")), route("/b", page("b")), route("/c", page("c"))),
+            value=Connection(scope={}, location=Location("/a", ""), carrier=None),
+        )
+
+    async def navigate(path):
+        set_location(Location(path, ""))
+        return str(await layout.render())
+
+    async with Layout(sample()) as layout:
+        await layout.render()
+        assert "'hidden': True" in await navigate("/b")
+
+        # Returning to a kept route doesn't mount it again
+        update = await navigate("/a")
+        assert "{'key': '^/a$', 'style': {'display': 'contents'}}" in update
+        assert "{'key': '^/b$', 'hidden': True}" in update
+        assert mounts == ["a", "b"]
+
+        # The least recently matched route is unmounted when the limit is reached
+        update = await navigate("/c")
+        assert "'^/b$'" not in update
+        await navigate("/b")
+        assert mounts == ["a", "b", "c", "b"]
+
+
+async def test_route_loaders_run_concurrently():
+    started = []
+    release = asyncio.Event()
+
+    def make_loader(name):
+        async def loader(params):
+            started.append(name)
+            await release.wait()
+            return f"{name} {params['id']}"
+
+        return loader
+
+    @component
+    def page():
+        return html.p({"id": "data"}, use_loader_data())
+
+    @component
+    def sample():
+        return ConnectionContext(
+            browser_router(
+                route(
+                    "/users",
+                    html.div(outlet()),
+                    route("/{id:int}", page(), loader=make_loader("user")),
+                    layout=True,
+                    loader=make_loader("users"),
+                )
+            ),
+            value=Connection(scope={}, location=Location("/users/1", ""), carrier=None),
+        )
+
+    async with Layout(sample()) as layout:
+        first = str(await layout.render())
+        assert "'data'" not in first
+
+        # Every loader is started before any of them has finished
+        while len(started) < 2:
+            await asyncio.sleep(0)
+        assert sorted(started) == ["user", "users"]
+
+        release.set()
+        update = str(await asyncio.wait_for(layout.render(), 1))
+        assert "user 1" in update
+
+
+def find_event_target(model, name):
+    if isinstance(model, dict):
+        if name in model.get("eventHandlers", {}):
+            return model["eventHandlers"][name]["target"]
+        for child in model.get("children", ()):
+            target = find_event_target(child, name)
+            if target is not None:
+                return target
+    return None
+
+
+async def test_prefetch_warms_loader_cache():
+    calls = []
+
+    async def loader(params):
+        calls.append(params)
+        return params["id"]
+
+    cache = LoaderCache()
+    cached_router = create_router(ReactPyResolver, loader_cache=cache)
+    lazy_calls = []
+
+    def make_element():
+        lazy_calls.append(None)
+        return html.p("lazy")
+
+    @component
+    def sample():
+        return ConnectionContext(
+            cached_router(route("/", html.p("home")), route("/users/{id:int}", make_element, loader=loader)),
+            value=Connection(scope={}, location=Location("/", ""), carrier=None),
+        )
+
+    async with Layout(sample()) as layout:
+        update = await layout.render()
+        target = find_event_target(update["model"], "onPrefetchCallback")
+
+        # Repeated and excessive prefetches are dropped
+        for user_id in [1, 1, *range(2, 12)]:
+            event = {"path": f"/users/{user_id}", "query_string": ""}
+            await layout.deliver({"type": "layout-event", "target": target, "data": [event]})
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert calls == [{"id": user_id} for user_id in range(1, 9)]
+        assert lazy_calls == [None]
+        assert len(cache) == 8
+
+
+async def test_superseded_navigation_is_cancelled():
+    started = []
+    cancelled = []
+    release = asyncio.Event()
+    navigations = []
+    navigate = None
+
+    async def loader(params):
+        started.append(params["name"])
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled.append(params["name"])
+            raise
+        return params["name"]
+
+    @component
+    def page():
+        nonlocal navigate
+        navigate = _use_route_state().on_client_location
+        navigation = use_navigation()
+        navigations.append((
+            navigation.state,
+            navigation.location.path,
+            getattr(navigation.pending_location, "path", None),
+        ))
+        return html.p(use_loader_data() or "home")
+
+    @component
+    def sample():
+        return ConnectionContext(
+            browser_router(route("/", page()), route("/{name}", page(), loader=loader)),
+            value=Connection(scope={}, location=Location("/", ""), carrier=None),
+        )
+
+    async with Layout(sample()) as layout:
+        await layout.render()
+        navigate({"path": "/a", "query_string": "", "seq": 1})
+        await layout.render()
+        assert navigations[-1] == ("loading", "/", "/a")
+
+        while not started:
+            await asyncio.sleep(0)
+        navigate({"path": "/b", "query_string": "", "seq": 2})
+        await layout.render()
+        assert navigations[-1] == ("loading", "/", "/b")
+        while not cancelled:
+            await asyncio.sleep(0)
+        assert cancelled == ["a"]
+
+        release.set()
+        assert "'b'" in str(await asyncio.wait_for(layout.render(), 1))
+        assert navigations[-1] == ("idle", "/b", None)
+
+
+async def test_redirects_render_in_one_pass():
+    @component
+    def page():
+        return html.p({"id": "location"}, use_location().path + use_location().query_string)
+
+    @component
+    def sample():
+        return ConnectionContext(
+            browser_router(route("/new", page()), redirect("/old", "/new")),
+            value=Connection(scope={}, location=Location("/old", "?a=1"), carrier=None),
+        )
+
+    async with Layout(sample()) as layout:
+        update = await layout.render()
+        assert "['/new?a=1']" in str(update)
+        # Only the browser's URL is replaced, since the target route was already rendered
+        assert "{'from': '/old?a=1', 'to': '/new?a=1', 'sequence': 0}" in str(update)
+
+
+def find_attribute_values(model, name):
+    values = []
+    if isinstance(model, dict):
+        if name in model.get("attributes", {}):
+            values.append(model["attributes"][name])
+        for child in model.get("children", ()):
+            values.extend(find_attribute_values(child, name))
+    return values
+
+
+async def test_routers_only_handle_their_own_links():
+    @component
+    def sample():
+        return ConnectionContext(
+            html.div(
+                browser_router(route("/", link({"to": "/a"}, "A"))),
+                browser_router(route("/", browser_router(route("/", link({"to": "/b"}, "B"))))),
+            ),
+            value=Connection(scope={}, location=Location("/", ""), carrier=None),
+        )
+
+    async with Layout(sample()) as layout:
+        model = (await layout.render())["model"]
+        # Each router's links are within an element marked with its ID, which its `LinkListener` looks for
+        router_ids = find_attribute_values(model, "data-reactpy-router")
+        assert len(set(router_ids)) == 3
+        assert find_attribute_values(model, "routerId") == router_ids
+
+
+async def test_prefetch_errors_are_misses(caplog):
+    @component
+    def sample():
+        return ConnectionContext(
+            browser_router(route("/", html.p("home")), redirect("/loop", "/loop")),
+            value=Connection(scope={}, location=Location("/", ""), carrier=None),
+        )
+
+    async with Layout(sample()) as layout:
+        update = await layout.render()
+        target = find_event_target(update["model"], "onPrefetchCallback")
+        await layout.deliver({
+            "type": "layout-event",
+            "target": target,
+            "data": [{"path": "/loop", "query_string": ""}],
+        })
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert "Failed to prefetch /loop" in caplog.text
+
+
+def test_accept_sequenced_event():
+    last_sequence = Ref(0)
+    event = {"path": "/a", "query_string": "", "seq": 2}
+    assert _accept_sequenced_event(event, last_sequence)
+    assert event == {"path": "/a", "query_string": ""}
+    assert last_sequence.current == 2
+
+    # Events that arrive out of order are dropped
+    assert not _accept_sequenced_event({"path": "/b", "query_string": "", "seq": 1}, last_sequence)
+    assert not _accept_sequenced_event({"path": "/b", "query_string": "", "seq": 2}, last_sequence)
+    assert _accept_sequenced_event({"path": "/b", "query_string": ""}, last_sequence)
+    assert last_sequence.current == 2
+
+
+def test_resolve_route_follows_redirects():
+    routes = [
+        route("/users/{id:int}", html.p("user")),
+        redirect("/people/{id:int}", "/members/{id}"),
+        redirect("/members/{id:int}", "/users/{id}?from=members"),
+        redirect("/loop", "/loop"),
+    ]
+    table, positions = _compile_routes(ReactPyResolver, routes)
+
+    key, match, _, location = _resolve_route(table, positions, routes, Location("/people/1", "?a=1"))
+    assert match == MatchedRoute(html.p({"key": key}, "user"), {"id": 1}, "/users/1")
+    assert location == Location("/users/1", "?from=members")
+    assert _resolve_route(table, positions, routes, Location("/users/1", "?a=1"))[3] == Location("/users/1", "?a=1")
+
+    with pytest.raises(RuntimeError, match="Too many redirects"):
+        _match_route(table, positions, routes, Location("/loop", ""))
@@ -0,0 +1,108 @@
+import json
+import re
+
+import pytest
+from reactpy import html
+from reactpy.types import Location
+
+from reactpy_router import route
+from reactpy_router.resolvers import AlternationResolver, ReactPyResolver, TrieResolver
+from reactpy_router.routers import _compile_routes, _iter_routes, _match_route
+from reactpy_router.serialization import dump_route_table, load_route_table
+from reactpy_router.tables import RouteTableCache, compile_table, fingerprint, table_cache
+from reactpy_router.types import MatchedRoute
+
+ROUTES = [
+    route("/", "root"),
+    route("/users", "users", route("/{id:int}", "user", route("/posts/{post:uuid}", "post"))),
+    route("/files/{rest:path}", "files"),
+    route("/file-{id:int}.txt", "file"),
+    route("{404:any}", "not found"),
+]
+PATHS = [
+    "/",
+    "/users",
+    "/users/42",
+    "/users/42/posts/1A2B3C4D-0000-0000-0000-000000000000",
+    "/files/a/b.txt",
+    "/file-7.txt",
+    "/missing",
+]
+
+
+@pytest.mark.parametrize("resolver", [ReactPyResolver, TrieResolver, AlternationResolver])
+def test_loaded_table_matches_compiled_table(tmp_path, resolver):
+    file = tmp_path / "routes.json"
+    dump_route_table(resolver, ROUTES, file)
+    table = load_route_table(resolver, file, RouteTableCache())
+
+    compiled = compile_table(resolver, fingerprint(route for _, route in _iter_routes(ROUTES)))
+    assert type(table) is type(compiled)
+    assert table.static_routes == compiled.static_routes
+    assert [compiled_route.key for compiled_route in table.routes] == [
+        compiled_route.key for compiled_route in compiled.routes
+    ]
+    for path in PATHS:
+        assert table.resolve(path) == compiled.resolve(path)
+
+
+def test_routers_use_loaded_table(tmp_path):
+    file = tmp_path / "routes.json"
+    dump_route_table(ReactPyResolver, ROUTES, file)
+    table = load_route_table(ReactPyResolver, file)
+    try:
+        # The router's compilation is skipped, but its own elements are still used
+        routes = [route("/", html.p("new root")), *ROUTES[1:]]
+        compiled, positions = _compile_routes(ReactPyResolver, routes)
+        assert compiled is table
+        match = _match_route(table, positions, routes, Location("/", ""))
+        assert match.element == html.p({"key": "^/$"}, "new root")
+    finally:
+        table_cache.clear()
+
+
+def test_outdated_tables_are_rejected(tmp_path):
+    file = tmp_path / "routes.json"
+    dump_route_table(ReactPyResolver, ROUTES, file)
+
+    with pytest.raises(ValueError, match=r"out of date \(changed: resolver\)"):
+        load_route_table(TrieResolver, file, RouteTableCache())
+
+    class CustomResolver(ReactPyResolver):
+        converters = {**ReactPyResolver.converters, "hex": {"regex": r"[0-9a-f]+", "func": str}}  # noqa: RUF012
+
+    with pytest.raises(ValueError, match=r"out of date \(changed: converters, resolver\)"):
+        load_route_table(CustomResolver, file, RouteTableCache())
+
+    header, body = file.read_text().split("\n", 1)
+    file.write_text(json.dumps({**json.loads(header), "format": 0}) + "\n" + body)
+    with pytest.raises(ValueError, match=r"out of date \(changed: format\)"):
+        load_route_table(ReactPyResolver, file, RouteTableCache())
+
+    file.write_text("{}")
+    with pytest.raises(ValueError, match=r"changed: converters, format, param_pattern, resolver, version"):
+        load_route_table(ReactPyResolver, file, RouteTableCache())
+
+
+def test_lazy_compile_applies_to_loaded_routes(tmp_path):
+    class LazyResolver(ReactPyResolver):
+        lazy_compile = True
+
+    file = tmp_path / "routes.json"
+    dump_route_table(LazyResolver, [route("/a/{x:int}", "a")], file)
+    (compiled_route,) = load_route_table(LazyResolver, file, RouteTableCache()).routes
+    assert "pattern" not in vars(compiled_route)
+    assert compiled_route.resolve("/a/1") == MatchedRoute(None, {"x": 1}, "/a/1")
+
+
+@pytest.mark.parametrize("resolver", [ReactPyResolver, TrieResolver, AlternationResolver])
+def test_loaded_routes_keep_pattern_flags(tmp_path, resolver):
+    class CaseInsensitiveResolver(resolver):
+        def parse_path(self, path):
+            return re.compile(self.build_pattern(path), re.IGNORECASE)
+
+    file = tmp_path / "routes.json"
+    dump_route_table(CaseInsensitiveResolver, [route("/users/{id:int}", "user")], file)
+    table = load_route_table(CaseInsensitiveResolver, file, RouteTableCache())
+    assert table.routes[0].pattern.flags & re.IGNORECASE
+    assert table.resolve("/USERS/1") == (0, MatchedRoute(None, {"id": 1}, "/USERS/1"))
@@ -0,0 +1,194 @@
+import threading
+from dataclasses import replace
+
+import pytest
+from reactpy import html
+from reactpy.types import Location
+
+from reactpy_router import route
+from reactpy_router.resolvers import AlternationResolver, ReactPyResolver, TrieResolver
+from reactpy_router.routers import _compile_routes, _match_route
+from reactpy_router.tables import RouteTable, RouteTableCache, compile_table, fingerprint, tree_fingerprint
+from reactpy_router.types import CacheInfo, MatchedRoute
+
+
+def test_fingerprint_ignores_elements():
+    assert fingerprint([route("/a", html.div()), route("/b", "b")]) == fingerprint([
+        route("/a", html.span()),
+        route("/b", None),
+    ])
+    assert fingerprint([route("/a", None)]) != fingerprint([route("/b", None)])
+
+
+def test_table_cache_shares_tables():
+    cache = RouteTableCache()
+    table = cache.get(ReactPyResolver, [route("/a", html.div()), route("/b/{x:int}", html.div())])
+
+    assert cache.get(ReactPyResolver, [route("/a", html.span()), route("/b/{x:int}", None)]) is table
+    assert cache.get(TrieResolver, [route("/a", None), route("/b/{x:int}", None)]) is not table
+    assert len(cache) == 2
+
+    # Cached tables don't hold on to any elements
+    assert all(compiled_route.element is None for compiled_route in table.routes)
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_table_cache_evicts_least_recently_used():
+    cache = RouteTableCache(maxsize=2)
+    table_a = cache.get(ReactPyResolver, [route("/a", None)])
+    cache.get(ReactPyResolver, [route("/b", None)])
+    assert cache.get(ReactPyResolver, [route("/a", None)]) is table_a
+
+    cache.get(ReactPyResolver, [route("/c", None)])
+    assert len(cache) == 2
+    assert cache.get(ReactPyResolver, [route("/a", None)]) is table_a
+
+
+def test_table_cache_is_thread_safe():
+    cache = RouteTableCache()
+    routes = [route(f"/{i}/{{x:int}}", None) for i in range(50)]
+    tables = []
+
+    def compile_routes():
+        tables.append(cache.get(ReactPyResolver, routes))
+
+    threads = [threading.Thread(target=compile_routes) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == 1
+    assert all(table is tables[0] for table in tables)
+
+
+def test_match_route_does_not_mutate_elements():
+    element = html.div({"id": "a"})
+    routes = [route("/a", element)]
+    table, positions = _compile_routes(ReactPyResolver, routes)
+
+    match = _match_route(table, positions, routes, Location("/a", ""))
+    assert match == MatchedRoute(html.div({"id": "a", "key": "^/a$"}), {}, "/a")
+    assert element == html.div({"id": "a"})
+    assert _match_route(table, positions, routes, Location("/b", "")) is None
+
+
+def test_match_route_uses_newest_elements():
+    def make_routes(text):
+        return [route("/a", html.p(text), route("/b", html.p(text), route("/{c:int}", html.p(text))))]
+
+    table, positions = _compile_routes(ReactPyResolver, make_routes("old"))
+    assert positions == ((0, 0, 0), (0, 0), (0,))
+    assert _compile_routes(ReactPyResolver, make_routes("new"))[0] is table
+
+    match = _match_route(table, positions, make_routes("new"), Location("/a/b/1", ""))
+    assert match == MatchedRoute(html.p({"key": "^/a/b/(?P<c>\\d+)$"}, "new"), {"c": 1}, "/a/b/1")
+
+
+def test_tree_fingerprint_ignores_elements():
+    assert tree_fingerprint([route("/a", html.div(), route("/b", "b"))]) == tree_fingerprint([
+        route("/a", None, route("/b", html.span()))
+    ])
+    assert tree_fingerprint([route("/a", None, route("/b", None))]) != tree_fingerprint([
+        route("/a", None),
+        route("/a/b", None),
+    ])
+
+
+def test_route_table_static_index():
+    table = compile_table(
+        ReactPyResolver,
+        [
+            route("/a", "a"),
+            route("/b/{x:int}", "b int"),
+            route("/b/1", "b static"),
+            route("/b/2", "b static 2"),
+            route("/a", "a duplicate"),
+        ],
+    )
+    assert table.static_routes == {"/a": 0, "/b/1": 2, "/b/2": 3}
+    assert [index for index, _ in table.dynamic_routes] == [1]
+
+    assert table.resolve("/a") == (0, MatchedRoute("a", {}, "/a"))
+    # The parameterized route was declared first, so it shadows the static route
+    assert table.resolve("/b/1") == (1, MatchedRoute("b int", {"x": 1}, "/b/1"))
+    assert table.resolve("/b/3") == (1, MatchedRoute("b int", {"x": 3}, "/b/3"))
+    assert table.resolve("/c") is None
+
+
+def test_route_table_without_static_paths():
+    table = RouteTable([ReactPyResolver(route("/a/{x}", "a")), StaticlessRoute(ReactPyResolver(route("/b", "b")))])
+    assert table.static_routes == {}
+    assert table.resolve("/b") == (1, MatchedRoute("b", {}, "/b"))
+
+
+def test_route_table_repeat_lookups_with_protocol_only_routes():
+    # `StaticlessRoute` only implements the `CompiledRoute` protocol, so repeat lookups can't rely on `element`
+    table = RouteTable([
+        StaticlessRoute(ReactPyResolver(route("/a/{x:int}", "a"))),
+        StaticlessRoute(ReactPyResolver(route("/b", "b"))),
+    ])
+    for _ in range(2):
+        assert table.resolve("/a/1") == (0, MatchedRoute("a", {"x": 1}, "/a/1"))
+        assert table.resolve("/b") == (1, MatchedRoute("b", {}, "/b"))
+
+
+class StaticlessRoute:
+    """A compiled route that doesn't expose a `static_path`."""
+
+    def __init__(self, compiled_route):
+        self.key = compiled_route.key
+        self.resolve = compiled_route.resolve
+
+
+def test_route_table_match_cache():
+    table = compile_table(ReactPyResolver, [route("/a/{x:int}", "a"), route("/b", "b")])
+    calls = []
+    match = table.match
+    table.match = lambda path: calls.append(path) or match(path)
+
+    for _ in range(3):
+        assert table.resolve("/a/1") == (0, MatchedRoute("a", {"x": 1}, "/a/1"))
+        assert table.resolve("/missing") is None
+
+    assert calls == ["/a/1", "/missing"]
+    assert table.match_cache.info() == CacheInfo(hits=4, misses=2, maxsize=256, currsize=2)
+
+    # Params returned from the cache can't be used to modify the cache
+    table.resolve("/a/1")[1].params["x"] = 2
+    assert table.resolve("/a/1")[1].params == {"x": 1}
+
+    table.match_cache.clear()
+    assert table.match_cache.info() == CacheInfo(hits=0, misses=0, maxsize=256, currsize=0)
+
+
+def test_route_table_match_cache_size():
+    table = RouteTable([ReactPyResolver(route("/{x}", "x"))], match_cache_size=1)
+    table.resolve("/a")
+    table.resolve("/b")
+    assert table.match_cache.info().currsize == 1
+
+    table = RouteTable([ReactPyResolver(route("/{x}", "x"))], match_cache_size=0)
+    assert table.resolve("/a") == (0, MatchedRoute("x", {"x": "a"}, "/a"))
+    assert table.match_cache.info() == CacheInfo(hits=0, misses=0, maxsize=0, currsize=0)
+
+
+@pytest.mark.parametrize("resolver", [ReactPyResolver, TrieResolver, AlternationResolver])
+def test_compile_table_match_cache_size(resolver):
+    table = compile_table(resolver, [route("/{x}", "x")], match_cache_size=1)
+    assert table.match_cache.info().maxsize == 1
+    assert compile_table(resolver, [route("/{x}", "x")]).match_cache.info().maxsize == 256
+
+
+def test_route_hashes_are_cached():
+    child = route("/b", "b")
+    parent = route("/a", "a", child)
+    assert hash(parent) == parent._hash == hash(("/a", id("a"), (child,)))
+
+    # Routes built with `replace` compute their own hashes
+    moved = replace(parent, path="/c")
+    assert hash(moved) != hash(parent)
+    assert moved._fingerprint != parent._fingerprint
+    assert replace(parent, element="c")._fingerprint == parent._fingerprint